@@ -2,98 +2,149 @@
 Agent 1: Timesheet Parser & Data Extraction Agent
 Extracts employee information and working hours from Excel/PDF timesheets
 """
-import pandas as pd
+import logging
 import os
-from typing import Dict
+from typing import Dict, Iterator, Tuple
 from models import TimesheetData, EmployeeInfo, WorkingHours, PayPeriod
 
+logger = logging.getLogger(__name__)
+
+# Daily statuses mapped to small integer codes once per row; unknown statuses map to 0
+STATUS_PRESENT, STATUS_HALF_DAY, STATUS_LEAVE, STATUS_HOLIDAY_WORK = 1, 2, 3, 4
+_STATUS_CODE = {
+    'Present': STATUS_PRESENT,
+    'Half Day': STATUS_HALF_DAY,
+    'Leave': STATUS_LEAVE,
+    'Holiday Work': STATUS_HOLIDAY_WORK,
+}
+
+# Last sheet column the parser reads (date, day, status, hours_worked, overtime_hours)
+MAX_COLUMN = 5
+
+# Prefer the Rust-based calamine reader; openpyxl's read-only mode is the fallback
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+
+def _iter_timesheet_rows(file_path: str) -> Iterator[Tuple]:
+    """Yield the first MAX_COLUMN cells of each Timesheet row, with empty cells as None"""
+    if CalamineWorkbook is not None:
+        wb = CalamineWorkbook.from_path(file_path)
+        try:
+            for row in wb.get_sheet_by_name('Timesheet').iter_rows():
+                # calamine reports empty cells as '' and every number as a float;
+                # match openpyxl so IDs and counts stringify the same way
+                yield tuple(
+                    None if value == '' else int(value) if isinstance(value, float) and value.is_integer() else value
+                    for value in row[:MAX_COLUMN]
+                )
+        finally:
+            wb.close()
+    else:
+        from openpyxl import load_workbook
+
+        wb = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            yield from wb['Timesheet'].iter_rows(max_col=MAX_COLUMN, values_only=True)
+        finally:
+            wb.close()
+
 
 class TimesheetParserAgent:
     """Agent responsible for parsing timesheets and extracting data"""
 
     def __init__(self):
         self.name = "Timesheet Parser Agent"
+        # Extraction details are logged at DEBUG; the default WARNING level keeps them silent
 
     def parse_excel_timesheet(self, file_path: str) -> Dict:
         """Parse Excel timesheet and extract structured data"""
-        print(f"\n[{self.name}] Parsing Excel file: {file_path}")
+        logger.debug("[%s] Parsing Excel file: %s", self.name, file_path)
 
         try:
-            # Read the Excel file
-            df = pd.read_excel(file_path, sheet_name='Timesheet')
-
-            # Extract employee information (rows 0-5)
+            # Stream the sheet once, keeping only the columns we read (A-E)
+            # and stopping as soon as the summary rates have been seen
+            rows = []
+            daily_start_row = None
+            summary_start_row = None
+            sheet_rows = _iter_timesheet_rows(file_path)
+            try:
+                for idx, row in enumerate(sheet_rows):
+                    rows.append(row)
+                    if summary_start_row is not None:
+                        if idx >= summary_start_row + 5:
+                            break
+                        continue
+
+                    # Find where daily records start (look for "date" header - lowercase)
+                    # and where the summary section starts (look for "Total Regular Hours")
+                    value = str(row[0]) if row else ''
+                    if daily_start_row is None and value.lower() == 'date':
+                        daily_start_row = idx
+                    elif value.startswith('Total Regular Hours'):
+                        summary_start_row = idx
+            finally:
+                sheet_rows.close()
+
+            # Extract employee information (rows 1-6, row 0 is the header)
             employee_data = {}
-            for idx in range(6):
-                field = df.iloc[idx, 0]
-                value = df.iloc[idx, 1]
-                if pd.notna(field) and pd.notna(value):
+            for row in rows[1:7]:
+                field, value = row[0], row[1]
+                if field is not None and value is not None:
                     employee_data[field] = str(value)
 
-            # Extract pay period (rows 8-9)
-            period_start = str(df.iloc[8, 1])
-            period_end = str(df.iloc[9, 1])
-
-            # Find where daily records start (look for "date" header - lowercase)
-            daily_start_row = None
-            for idx in range(len(df)):
-                if str(df.iloc[idx, 0]).lower() == 'date':
-                    daily_start_row = idx
-                    break
+            # Extract pay period (rows 9-10)
+            period_start = str(rows[9][1])
+            period_end = str(rows[10][1])
 
             if daily_start_row is None:
                 raise ValueError("Could not find daily attendance records in timesheet")
 
-            # Extract daily records - read with header
-            daily_df = pd.read_excel(
-                file_path,
-                sheet_name='Timesheet',
-                skiprows=daily_start_row,
-                nrows=32  # Maximum days in a month + 1 for header
-            )
-
-            # The first row should be the header, set it as column names
-            daily_df.columns = daily_df.iloc[0]
-            daily_df = daily_df[1:]  # Remove the header row from data
-            daily_df = daily_df.reset_index(drop=True)
-
-            # Remove any rows with NaN in 'date' column (blank rows)
-            if 'date' in daily_df.columns:
-                daily_df = daily_df[daily_df['date'].notna()]
-            else:
-                raise ValueError(f"'date' column not found. Available columns: {daily_df.columns.tolist()}")
-
-            # Calculate working hours summary
-            # Filter out weekends and leaves
-            work_days = daily_df[daily_df['status'].isin(['Present', 'Half Day'])]
-            regular_hours = work_days['hours_worked'].sum()
-            overtime_hours = daily_df['overtime_hours'].sum()
-            leave_days = len(daily_df[daily_df['status'] == 'Leave'])
-            holiday_work_hours = daily_df[daily_df['status'] == 'Holiday Work']['hours_worked'].sum()
-
-            # Find summary section (look for "Total Regular Hours")
-            summary_start_row = None
-            for idx in range(len(df)):
-                if str(df.iloc[idx, 0]).startswith('Total Regular Hours'):
-                    summary_start_row = idx
+            # Map the daily header names to column indices
+            header = [str(name) for name in rows[daily_start_row]]
+            try:
+                status_idx = header.index('status')
+                hours_idx = header.index('hours_worked')
+                overtime_idx = header.index('overtime_hours')
+            except ValueError:
+                raise ValueError(f"Daily attendance columns not found. Available columns: {header}")
+
+            # Extract daily records up to the first row without a date as
+            # (status code, hours worked, overtime hours)
+            daily_rows = []
+            for row in rows[daily_start_row + 1:]:
+                if not row or row[0] is None:
                     break
+                daily_rows.append((_STATUS_CODE.get(row[status_idx], 0), row[hours_idx] or 0, row[overtime_idx] or 0))
+
+            # Calculate working hours summary in a single pass
+            regular_hours = 0.0
+            overtime_hours = 0.0
+            leave_days = 0
+            holiday_work_hours = 0.0
+            for code, hours, overtime in daily_rows:
+                if code == STATUS_PRESENT or code == STATUS_HALF_DAY:
+                    regular_hours += hours
+                elif code == STATUS_LEAVE:
+                    leave_days += 1
+                elif code == STATUS_HOLIDAY_WORK:
+                    holiday_work_hours += hours
+                overtime_hours += overtime
+
+            if summary_start_row is None:
+                raise ValueError("Could not find summary section in timesheet")
 
             # Extract rates from summary
-            summary_df = pd.read_excel(
-                file_path,
-                sheet_name='Timesheet',
-                skiprows=summary_start_row,
-                nrows=6
-            )
+            hourly_rate = float(rows[summary_start_row + 4][1])
+            overtime_rate = float(rows[summary_start_row + 5][1])
 
-            hourly_rate = float(summary_df.iloc[4, 1])
-            overtime_rate = float(summary_df.iloc[5, 1])
-
-            print(f"[{self.name}] Successfully extracted data:")
-            print(f"  - Employee: {employee_data.get('Name', 'Unknown')}")
-            print(f"  - Regular Hours: {regular_hours}")
-            print(f"  - Overtime Hours: {overtime_hours}")
-            print(f"  - Leave Days: {leave_days}")
+            logger.debug("[%s] Successfully extracted data:", self.name)
+            logger.debug("  - Employee: %s", employee_data.get('Name', 'Unknown'))
+            logger.debug("  - Regular Hours: %s", regular_hours)
+            logger.debug("  - Overtime Hours: %s", overtime_hours)
+            logger.debug("  - Leave Days: %s", leave_days)
 
             # Structure the data
             timesheet_data = TimesheetData(
@@ -126,7 +177,7 @@ class TimesheetParserAgent:
             }
 
         except Exception as e:
-            print(f"[{self.name}] Error parsing timesheet: {str(e)}")
+            logger.error("[%s] Error parsing timesheet: %s", self.name, e)
             return {
                 "success": False,
                 "data": None,
@@ -135,7 +186,7 @@ class TimesheetParserAgent:
 
     def parse_pdf_timesheet(self, file_path: str) -> Dict:
         """Parse PDF timesheet - placeholder for future implementation"""
-        print(f"[{self.name}] PDF parsing not yet implemented. Please use Excel format.")
+        logger.warning("[%s] PDF parsing not yet implemented. Please use Excel format.", self.name)
         return {
             "success": False,
             "data": None,
@@ -144,9 +195,7 @@ class TimesheetParserAgent:
 
     def process(self, file_path: str) -> Dict:
         """Main processing method - determines file type and parses accordingly"""
-        print(f"\n{'='*60}")
-        print(f"[{self.name}] Starting timesheet extraction")
-        print(f"{'='*60}")
+        logger.debug("[%s] Starting timesheet extraction", self.name)
 
         if not os.path.exists(file_path):
             return {
@@ -172,6 +221,8 @@ class TimesheetParserAgent:
 
 # Test function
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+
     agent = TimesheetParserAgent()
 
     # Test with a sample timesheet
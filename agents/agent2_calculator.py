@@ -3,15 +3,94 @@ Agent 2: Wage Calculator & Tax Processor Agent
 Calculates gross salary, deductions, and net salary
 """
 from datetime import datetime
-from typing import Dict
+from functools import lru_cache
+import logging
+from typing import Dict, List, Optional, Tuple
+import numpy as np
 from models import TimesheetData, SalaryCalculation, GrossSalary, Deductions
 
+logger = logging.getLogger(__name__)
+
+
+def _round_cents(values: np.ndarray) -> np.ndarray:
+    """Round an array to cents exactly like the scalar path does"""
+    values = np.asarray(values, dtype=float)
+    scaled = values * 100
+    # k / 100 is correctly rounded, so this matches round(value, 2) whenever
+    # np.round picks the same whole cent k
+    rounded = np.round(scaled) / 100
+
+    # Scaling can nudge a value sitting on a half cent across it, so those are
+    # left to round(), which rounds the exact binary value
+    near_half = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < 1e-6
+    if near_half.any():
+        rounded[near_half] = [round(value, 2) for value in values[near_half].tolist()]
+    return rounded
+
+
+def _progressive_tax(gross_salary: float, brackets_key: Tuple[Tuple[float, float], ...]) -> float:
+    """Calculate progressive income tax for a gross salary"""
+    tax = 0.0
+    previous_limit = 0
+
+    for limit, rate in brackets_key:
+        if gross_salary > previous_limit:
+            taxable_in_bracket = min(gross_salary - previous_limit, limit - previous_limit)
+            tax += taxable_in_bracket * rate
+            previous_limit = limit
+
+            if gross_salary <= limit:
+                break
+
+    return round(tax, 2)
+
+
+def _deductions(gross_salary: float, rates_key: Tuple) -> Tuple[float, ...]:
+    """Calculate the rounded deduction amounts for a gross salary
+
+    Returns (income_tax, fica_total, insurance, provident_fund, other_deductions, total_deductions).
+    """
+    social_security_rate, medicare_rate, insurance_flat, provident_fund_rate, brackets_key = rates_key
+
+    # Income tax (progressive)
+    income_tax = _progressive_tax(gross_salary, brackets_key)
+
+    # Social Security (6.2% of gross, capped at $160,200 annually) + Medicare (1.45% of gross)
+    social_security = gross_salary * social_security_rate
+    medicare = gross_salary * medicare_rate
+    fica_total = social_security + medicare
+
+    # Insurance (flat rate) and Provident Fund (5% of gross)
+    insurance = insurance_flat
+    provident_fund = gross_salary * provident_fund_rate
+
+    # Other deductions
+    other_deductions = 0.0
+
+    total_deductions = income_tax + fica_total + insurance + provident_fund + other_deductions
+
+    return (
+        income_tax,
+        round(fica_total, 2),
+        round(insurance, 2),
+        round(provident_fund, 2),
+        round(other_deductions, 2),
+        round(total_deductions, 2)
+    )
+
+
+@lru_cache(maxsize=4096)
+def _deductions_cents(gross_cents: int, rates_key: Tuple) -> Tuple[float, ...]:
+    """Cached _deductions for a gross salary that is already a whole number of cents"""
+    return _deductions(gross_cents / 100, rates_key)
+
 
 class WageCalculatorAgent:
     """Agent responsible for calculating wages and processing taxes"""
 
     def __init__(self):
         self.name = "Wage Calculator Agent"
+        # Calculation details are logged at DEBUG; the default WARNING level keeps them silent
 
         # Tax brackets (simplified US federal tax for demonstration)
         self.tax_brackets = [
@@ -27,51 +106,72 @@ class WageCalculatorAgent:
         self.insurance_flat = 100.0       # $100 flat rate
         self.provident_fund_rate = 0.05   # 5%
 
-    def calculate_progressive_tax(self, gross_salary: float) -> float:
-        """Calculate income tax using progressive tax brackets"""
-        tax = 0.0
-        previous_limit = 0
+        self.refresh_settings()
+
+    def refresh_settings(self):
+        """Snapshot the brackets and rates; call after changing any of them
+
+        Every calculation, scalar or batch, reads the settings from this snapshot,
+        so changes to the attributes above take effect only once this is called.
+        """
+        # Hashable snapshots of the brackets and rates used as cache keys; cached
+        # amounts for the old settings are simply never looked up again
+        self._brackets_key = tuple((bracket["limit"], bracket["rate"]) for bracket in self.tax_brackets)
+        self._deduction_rates_key = (
+            self.social_security_rate,
+            self.medicare_rate,
+            self.insurance_flat,
+            self.provident_fund_rate,
+            self._brackets_key
+        )
 
-        for bracket in self.tax_brackets:
-            if gross_salary > previous_limit:
-                taxable_in_bracket = min(gross_salary - previous_limit, bracket["limit"] - previous_limit)
-                tax += taxable_in_bracket * bracket["rate"]
-                previous_limit = bracket["limit"]
+        # Bracket edges and rates from the same snapshot, as parallel arrays for vectorized tax
+        self._limits = np.array([0.0] + [limit for limit, _ in self._brackets_key])
+        self._rates = np.array([rate for _, rate in self._brackets_key])
 
-                if gross_salary <= bracket["limit"]:
-                    break
+    def calc_tax_vec(self, gross: np.ndarray) -> np.ndarray:
+        """Calculate progressive income tax for an array of gross salaries"""
+        gross = np.asarray(gross, dtype=float)[:, None]
+        upper = np.minimum(gross, self._limits[1:])
+        lower = np.minimum(gross, self._limits[:-1])
+        return _round_cents(((upper - lower).clip(0) * self._rates).sum(axis=1))
 
-        return round(tax, 2)
+    def calculate_progressive_tax(self, gross_salary: float) -> float:
+        """Calculate income tax using progressive tax brackets"""
+        return _progressive_tax(gross_salary, self._brackets_key)
 
     def calculate_gross_salary(self, timesheet_data: TimesheetData) -> GrossSalary:
         """Calculate gross salary from timesheet data"""
-        print(f"\n[{self.name}] Calculating gross salary...")
+        logger.debug("[%s] Calculating gross salary...", self.name)
 
         # Base pay: regular hours × hourly rate
         base_pay = timesheet_data.hours.regular_hours * timesheet_data.hourly_rate
-        print(f"  - Base Pay: {timesheet_data.hours.regular_hours} hrs × ${timesheet_data.hourly_rate} = ${base_pay:.2f}")
+        logger.debug("  - Base Pay: %s hrs × $%s = $%.2f",
+                     timesheet_data.hours.regular_hours, timesheet_data.hourly_rate, base_pay)
 
         # Overtime pay: overtime hours × overtime rate
         overtime_pay = timesheet_data.hours.overtime_hours * timesheet_data.overtime_rate
-        print(f"  - Overtime Pay: {timesheet_data.hours.overtime_hours} hrs × ${timesheet_data.overtime_rate} = ${overtime_pay:.2f}")
+        logger.debug("  - Overtime Pay: %s hrs × $%s = $%.2f",
+                     timesheet_data.hours.overtime_hours, timesheet_data.overtime_rate, overtime_pay)
 
         # Holiday work: extra pay (1.5x)
         holiday_bonus = timesheet_data.hours.holiday_work_hours * timesheet_data.hourly_rate * 0.5
-        print(f"  - Holiday Bonus: {timesheet_data.hours.holiday_work_hours} hrs × ${timesheet_data.hourly_rate} × 0.5 = ${holiday_bonus:.2f}")
+        logger.debug("  - Holiday Bonus: %s hrs × $%s × 0.5 = $%.2f",
+                     timesheet_data.hours.holiday_work_hours, timesheet_data.hourly_rate, holiday_bonus)
 
         # Allowances (fixed for demonstration)
         allowances = 500.0  # Transportation, housing, etc.
-        print(f"  - Allowances: ${allowances:.2f}")
+        logger.debug("  - Allowances: $%.2f", allowances)
 
         # Bonuses (performance-based - random for demo)
         bonuses = 0.0
         if timesheet_data.hours.regular_hours >= 160:  # Full month
             bonuses = 200.0
-        print(f"  - Bonuses: ${bonuses:.2f}")
+        logger.debug("  - Bonuses: $%.2f", bonuses)
 
         # Total gross
         total_gross = base_pay + overtime_pay + holiday_bonus + allowances + bonuses
-        print(f"  - Total Gross Salary: ${total_gross:.2f}")
+        logger.debug("  - Total Gross Salary: $%.2f", total_gross)
 
         return GrossSalary(
             base_pay=round(base_pay, 2),
@@ -83,74 +183,78 @@ class WageCalculatorAgent:
 
     def calculate_deductions(self, gross_salary: float) -> Deductions:
         """Calculate all deductions from gross salary"""
-        print(f"\n[{self.name}] Calculating deductions...")
-
-        # Income tax (progressive)
-        income_tax = self.calculate_progressive_tax(gross_salary)
-        print(f"  - Income Tax: ${income_tax:.2f}")
-
-        # Social Security (6.2% of gross, capped at $160,200 annually)
-        social_security = gross_salary * self.social_security_rate
-        print(f"  - Social Security: ${social_security:.2f}")
-
-        # Medicare (1.45% of gross)
-        medicare = gross_salary * self.medicare_rate
-
-        # Total FICA (Social Security + Medicare)
-        fica_total = social_security + medicare
-        print(f"  - FICA (SS + Medicare): ${fica_total:.2f}")
-
-        # Insurance (flat rate)
-        insurance = self.insurance_flat
-        print(f"  - Insurance: ${insurance:.2f}")
-
-        # Provident Fund (5% of gross)
-        provident_fund = gross_salary * self.provident_fund_rate
-        print(f"  - Provident Fund: ${provident_fund:.2f}")
-
-        # Other deductions
-        other_deductions = 0.0
+        logger.debug("[%s] Calculating deductions...", self.name)
 
-        # Total deductions
-        total_deductions = income_tax + fica_total + insurance + provident_fund + other_deductions
-        print(f"  - Total Deductions: ${total_deductions:.2f}")
+        income_tax, fica_total, insurance, provident_fund, other_deductions, total_deductions = _deductions(
+            gross_salary, self._deduction_rates_key
+        )
+        logger.debug("  - Income Tax: $%.2f", income_tax)
+        logger.debug("  - FICA (SS + Medicare): $%.2f", fica_total)
+        logger.debug("  - Insurance: $%.2f", insurance)
+        logger.debug("  - Provident Fund: $%.2f", provident_fund)
+        logger.debug("  - Total Deductions: $%.2f", total_deductions)
 
         return Deductions(
-            income_tax=round(income_tax, 2),
-            social_security=round(fica_total, 2),
-            insurance=round(insurance, 2),
-            provident_fund=round(provident_fund, 2),
-            other_deductions=round(other_deductions, 2),
-            total_deductions=round(total_deductions, 2)
+            income_tax=income_tax,
+            social_security=fica_total,
+            insurance=insurance,
+            provident_fund=provident_fund,
+            other_deductions=other_deductions,
+            total_deductions=total_deductions
         )
 
-    def process(self, timesheet_data: TimesheetData) -> Dict:
+    def _compute_salary(self, timesheet_data: TimesheetData, calculation_date: str) -> SalaryCalculation:
+        """Calculate gross, deductions and net salary in one pass with the same rounding as the step-by-step methods"""
+        hours = timesheet_data.hours
+        rate = timesheet_data.hourly_rate
+        regular_hours = hours.regular_hours
+
+        base_pay = regular_hours * rate
+        overtime_pay = hours.overtime_hours * timesheet_data.overtime_rate
+        holiday_bonus = hours.holiday_work_hours * rate * 0.5
+        allowances = 500.0
+        bonuses = 200.0 if regular_hours >= 160 else 0.0
+        total_gross = round(base_pay + overtime_pay + holiday_bonus + allowances + bonuses, 2)
+
+        # total_gross is rounded to cents, so the cached cents lookup gives the same amounts
+        income_tax, fica_total, insurance, provident_fund, other_deductions, total_deductions = _deductions_cents(
+            int(round(total_gross * 100)), self._deduction_rates_key
+        )
+        net_salary = round(total_gross - total_deductions, 2)
+        logger.debug("[%s] Gross Salary: $%.2f, Net Salary: $%.2f", self.name, total_gross, net_salary)
+
+        return SalaryCalculation(
+            employee_id=timesheet_data.employee.employee_id,
+            gross_salary=GrossSalary(
+                base_pay=round(base_pay, 2),
+                overtime_pay=round(overtime_pay, 2),
+                allowances=round(allowances + holiday_bonus, 2),
+                bonuses=bonuses,
+                total_gross=total_gross
+            ),
+            deductions=Deductions(
+                income_tax=income_tax,
+                social_security=fica_total,
+                insurance=insurance,
+                provident_fund=provident_fund,
+                other_deductions=other_deductions,
+                total_deductions=total_deductions
+            ),
+            net_salary=net_salary,
+            calculation_date=calculation_date
+        )
+
+    def process(self, timesheet_data: TimesheetData, now: Optional[datetime] = None) -> Dict:
         """Main processing method - calculates complete salary breakdown"""
-        print(f"\n{'='*60}")
-        print(f"[{self.name}] Starting wage calculation")
-        print(f"{'='*60}")
+        logger.debug("[%s] Starting wage calculation", self.name)
 
         try:
-            # Calculate gross salary
-            gross_salary = self.calculate_gross_salary(timesheet_data)
-
-            # Calculate deductions
-            deductions = self.calculate_deductions(gross_salary.total_gross)
-
-            # Calculate net salary
-            net_salary = gross_salary.total_gross - deductions.total_deductions
-            print(f"\n[{self.name}] Net Salary: ${net_salary:.2f}")
-
-            # Create salary calculation object
-            salary_calculation = SalaryCalculation(
-                employee_id=timesheet_data.employee.employee_id,
-                gross_salary=gross_salary,
-                deductions=deductions,
-                net_salary=round(net_salary, 2),
-                calculation_date=datetime.now().strftime("%Y-%m-%d")
+            # Calculate gross salary, deductions and net salary
+            salary_calculation = self._compute_salary(
+                timesheet_data, (now or datetime.now()).strftime("%Y-%m-%d")
             )
 
-            print(f"\n[{self.name}] ✓ Calculation completed successfully!")
+            logger.debug("[%s] ✓ Calculation completed successfully!", self.name)
 
             return {
                 "success": True,
@@ -159,18 +263,105 @@ class WageCalculatorAgent:
             }
 
         except Exception as e:
-            print(f"\n[{self.name}] ✗ Error during calculation: {str(e)}")
+            logger.error("[%s] ✗ Error during calculation: %s", self.name, e)
             return {
                 "success": False,
                 "data": None,
                 "error": str(e)
             }
 
+    def process_batch(self, timesheets: List[TimesheetData], now: Optional[datetime] = None) -> List[Dict]:
+        """Calculate salaries for many employees, vectorizing the gross and deduction math"""
+        logger.debug("[%s] Starting batch wage calculation for %d employees", self.name, len(timesheets))
+
+        try:
+            # Stack the per-employee inputs into columns (structure of arrays)
+            regular_hours = np.array([timesheet_data.hours.regular_hours for timesheet_data in timesheets], dtype=float)
+            overtime_hours = np.array([timesheet_data.hours.overtime_hours for timesheet_data in timesheets], dtype=float)
+            holiday_hours = np.array([timesheet_data.hours.holiday_work_hours for timesheet_data in timesheets], dtype=float)
+            hourly_rate = np.array([timesheet_data.hourly_rate for timesheet_data in timesheets], dtype=float)
+            overtime_rate = np.array([timesheet_data.overtime_rate for timesheet_data in timesheets], dtype=float)
+
+            # Gross salary, summed in the same order as calculate_gross_salary
+            base_pay = regular_hours * hourly_rate
+            overtime_pay = overtime_hours * overtime_rate
+            holiday_bonus = holiday_hours * hourly_rate * 0.5
+            allowances = 500.0
+            bonuses = np.where(regular_hours >= 160, 200.0, 0.0)
+            gross = _round_cents(base_pay + overtime_pay + holiday_bonus + allowances + bonuses)
+            base_pay = _round_cents(base_pay)
+            overtime_pay = _round_cents(overtime_pay)
+            allowances = _round_cents(allowances + holiday_bonus)
+
+            # Same rate snapshot the scalar path uses
+            social_security_rate, medicare_rate, insurance_flat, provident_fund_rate, _ = self._deduction_rates_key
+            income_tax = self.calc_tax_vec(gross)
+            fica_total = gross * social_security_rate + gross * medicare_rate
+            provident_fund = gross * provident_fund_rate
+            total_deductions = income_tax + fica_total + insurance_flat + provident_fund
+            total_deductions = _round_cents(total_deductions)
+            net_salary = _round_cents(gross - total_deductions)
+            fica_total = _round_cents(fica_total)
+            provident_fund = _round_cents(provident_fund)
+            calculation_date = (now or datetime.now()).strftime("%Y-%m-%d")
+
+            # Missing rates or hours come through as NaN; the scalar path raises on
+            # those rows, so hand them to it to get the same failure result
+            valid = np.isfinite(regular_hours + overtime_hours + holiday_hours + hourly_rate + overtime_rate).tolist()
+
+            insurance = round(insurance_flat, 2)
+            results = []
+            columns = zip(timesheets, valid, base_pay.tolist(), overtime_pay.tolist(), allowances.tolist(),
+                          bonuses.tolist(), gross.tolist(), income_tax.tolist(), fica_total.tolist(),
+                          provident_fund.tolist(), total_deductions.tolist(), net_salary.tolist())
+            for (timesheet_data, is_valid, base_pay_value, overtime_pay_value, allowances_value, bonuses_value,
+                 gross_value, income_tax_value, fica_value, provident_fund_value, total_deductions_value,
+                 net_salary_value) in columns:
+                if not is_valid:
+                    results.append(self.process(timesheet_data, now))
+                    continue
+
+                results.append({
+                    "success": True,
+                    "data": SalaryCalculation(
+                        employee_id=timesheet_data.employee.employee_id,
+                        gross_salary=GrossSalary(
+                            base_pay=base_pay_value,
+                            overtime_pay=overtime_pay_value,
+                            allowances=allowances_value,
+                            bonuses=bonuses_value,
+                            total_gross=gross_value
+                        ),
+                        deductions=Deductions(
+                            income_tax=income_tax_value,
+                            social_security=fica_value,
+                            insurance=insurance,
+                            provident_fund=provident_fund_value,
+                            other_deductions=0.0,
+                            total_deductions=total_deductions_value
+                        ),
+                        net_salary=net_salary_value,
+                        calculation_date=calculation_date
+                    ),
+                    "error": None
+                })
+
+            logger.debug("[%s] ✓ Batch calculation completed successfully!", self.name)
+            return results
+
+        except Exception as e:
+            logger.error("[%s] ✗ Error during batch calculation: %s", self.name, e)
+            return [{"success": False, "data": None, "error": str(e)} for _ in timesheets]
+
 
 # Test function
 if __name__ == "__main__":
+    from dataclasses import asdict
+    import json
     from models import EmployeeInfo, WorkingHours, PayPeriod
 
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+
     # Create sample timesheet data
     sample_timesheet = TimesheetData(
         employee=EmployeeInfo(
@@ -202,4 +393,4 @@ if __name__ == "__main__":
         print("\n" + "="*60)
         print("CALCULATION SUMMARY")
         print("="*60)
-        print(result["data"].model_dump_json(indent=2))
+        print(json.dumps(asdict(result["data"]), indent=2))
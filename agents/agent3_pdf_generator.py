@@ -2,22 +2,113 @@
 Agent 3: Salary Slip PDF Generator Agent
 Generates professional PDF salary slips
 """
-from reportlab.lib.pagesizes import letter
 from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
+import io
+import logging
 import os
-from typing import Dict
+import uuid
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple, Union
 from models import SalarySlipData, TimesheetData, SalaryCalculation
 
+if TYPE_CHECKING:
+    from reportlab.pdfgen.canvas import Canvas
+
+logger = logging.getLogger(__name__)
+
+# Slip colour palette, parsed once
+C_TITLE = colors.HexColor('#1a365d')
+C_COMPANY = colors.HexColor('#4a5568')
+C_EMP_HEAD = colors.HexColor('#2d3748')
+C_EMP_BG = colors.HexColor('#f7fafc')
+C_EMP_GRID = colors.HexColor('#cbd5e0')
+C_HOURS_HEAD = colors.HexColor('#2c5282')
+C_HOURS_BG = colors.HexColor('#ebf8ff')
+C_HOURS_GRID = colors.HexColor('#4299e1')
+C_EARN_HEAD = colors.HexColor('#2d5016')
+C_EARN_BG = colors.HexColor('#f0fff4')
+C_EARN_TOTAL = colors.HexColor('#68d391')
+C_EARN_GRID = colors.HexColor('#9ae6b4')
+C_DED_HEAD = colors.HexColor('#742a2a')
+C_DED_BG = colors.HexColor('#fff5f5')
+C_DED_TOTAL = colors.HexColor('#fc8181')
+C_DED_GRID = colors.HexColor('#feb2b2')
+C_FOOTER = colors.HexColor('#718096')
+C_HEADER_TEXT = colors.whitesmoke
+C_TEXT = colors.black
+
+# Footer timestamp format, e.g. "October 20, 2025 at 09:30 AM"
+FOOTER_DATE_FORMAT = '%B %d, %Y at %I:%M %p'
+
+# Threads that write finished batch PDFs to disk while the next slips render
+IO_WRITER_THREADS = 4
+
 
 class SalarySlipGeneratorAgent:
     """Agent responsible for generating PDF salary slips"""
 
+    # Fixed slip layout in points (origin at the bottom-left corner of a letter page)
+    _LAYOUT = {
+        "center_x": letter[0] / 2,
+        "title_y": 688,
+        "company_y": (647.6, 635.6),
+        "period_y": 601,
+        "emp_table": (68.4, 575.6),
+        "hours_table": (126, 473),
+        "earnings_table": (126, 354.4),
+        "deductions_table": (126, 225),
+        # Second page
+        "net_table": (126, 692.4),
+        "footer_y": (613.6, 601.6, 582.4),
+    }
+
+    # Table styles: header/body/total row fills and fonts, grid colour and width
+    _EMP_TABLE = {
+        "col_widths": (1.3*inch, 2*inch, 1.3*inch, 2*inch),
+        "header_fill": C_EMP_HEAD, "header_size": 12, "header_padding": (3, 12),
+        "body_fill": C_EMP_BG, "body_size": 9, "bold_columns": (0, 2),
+        "grid": C_EMP_GRID, "grid_width": 1, "span_header": True,
+    }
+    _HOURS_TABLE = {
+        "col_widths": (3*inch, 2*inch),
+        "header_fill": C_HOURS_HEAD, "header_size": 11, "header_padding": (3, 10),
+        "body_fill": C_HOURS_BG, "body_size": 10, "bold_columns": (0,),
+        "grid": C_HOURS_GRID, "grid_width": 1, "span_header": True,
+    }
+    _EARN_TABLE = {
+        "col_widths": (3*inch, 2*inch),
+        "header_fill": C_EARN_HEAD, "header_size": 11, "header_padding": (3, 10),
+        "body_fill": C_EARN_BG, "body_size": 10, "bold_columns": (),
+        "total_fill": C_EARN_TOTAL, "total_size": 11,
+        "grid": C_EARN_GRID, "grid_width": 1, "right_align": True,
+    }
+    _DED_TABLE = {
+        "col_widths": (3*inch, 2*inch),
+        "header_fill": C_DED_HEAD, "header_size": 11, "header_padding": (3, 10),
+        "body_fill": C_DED_BG, "body_size": 10, "bold_columns": (),
+        "total_fill": C_DED_TOTAL, "total_size": 11,
+        "grid": C_DED_GRID, "grid_width": 1, "right_align": True,
+    }
+    _NET_TABLE = {
+        "col_widths": (3*inch, 2*inch),
+        "header_fill": C_TITLE, "header_size": 14, "header_padding": (15, 15),
+        "grid": C_HOURS_HEAD, "grid_width": 2, "right_align": True,
+    }
+
+    # Every table row is one 12pt line plus its top and bottom padding
+    _LEADING = 12
+    _CELL_PADDING = 6
+
+    # Bold label in front of the pay period dates
+    _PERIOD_LABEL = "Pay Period:"
+
     def __init__(self, output_dir: str = None):
         self.name = "Salary Slip Generator Agent"
+        # Slip progress is logged at INFO; the default WARNING level keeps it silent
         # Auto-detect path: /data/salary_slips/ in K8s, ./salary_slips locally
         if output_dir is None:
             if os.path.exists("/data"):
@@ -29,237 +120,269 @@ class SalarySlipGeneratorAgent:
         # Create output directory if it doesn't exist
         os.makedirs(self.output_dir, exist_ok=True)
 
-    def generate_filename(self, employee_id: str, employee_name: str, period_end: str) -> str:
+        # The pay period label never changes, so measure it once per agent
+        from reportlab.pdfbase.pdfmetrics import stringWidth
+        self._period_label_width = stringWidth(self._PERIOD_LABEL, 'Helvetica-Bold', 11)
+
+        # The table chrome never changes between slips, so lay it out once per agent
+        layout = self._LAYOUT
+        self._templates = {
+            "emp_table": self._build_table_template(*layout["emp_table"], 4, self._EMP_TABLE),
+            "hours_table": self._build_table_template(*layout["hours_table"], 5, self._HOURS_TABLE),
+            "earnings_table": self._build_table_template(*layout["earnings_table"], 6, self._EARN_TABLE),
+            "deductions_table": self._build_table_template(*layout["deductions_table"], 7, self._DED_TABLE),
+            "net_table": self._build_table_template(*layout["net_table"], 1, self._NET_TABLE),
+        }
+
+    def generate_filename(self, employee_id: str, employee_name: str, period_end: str) -> Path:
         """Generate filename for the salary slip"""
         clean_name = employee_name.replace(" ", "_")
         period = period_end.replace("-", "")
         filename = f"{employee_id}_{clean_name}_SalarySlip_{period}.pdf"
-        return os.path.join(self.output_dir, filename)
-
-    def create_salary_slip_pdf(self, slip_data: SalarySlipData, output_path: str) -> bool:
+        return Path(self.output_dir, filename)
+
+    def _build_table_template(self, x: float, top: float, row_count: int, style: Dict) -> Dict:
+        """Lay out a table's fixed chrome once: column edges, row fills, grid lines and text metrics"""
+        col_x = [x]
+        for width in style["col_widths"]:
+            col_x.append(col_x[-1] + width)
+        right = col_x[-1]
+
+        # Lay out the rows: fill boxes plus (baseline, font size, bold columns, text color) for the text
+        all_columns = range(len(col_x) - 1)
+        fills = []
+        text_rows = []
+        y = top
+        for idx in range(row_count):
+            if idx == 0:
+                top_padding, bottom_padding = style["header_padding"]
+                fill, size, bold, text_color = style["header_fill"], style["header_size"], all_columns, C_HEADER_TEXT
+            elif idx == row_count - 1 and "total_fill" in style:
+                top_padding, bottom_padding = 3, 3
+                fill, size, bold, text_color = style["total_fill"], style["total_size"], all_columns, C_TEXT
+            else:
+                top_padding, bottom_padding = 3, 3
+                fill, size, bold, text_color = style["body_fill"], style["body_size"], style["bold_columns"], C_TEXT
+            height = top_padding + self._LEADING + bottom_padding
+            y -= height
+            fills.append((fill, y, height))
+            text_rows.append((y + bottom_padding + self._LEADING - size, size, bold, text_color))
+        bottom = y
+
+        # Grid: every row boundary, the outer edges and the inner column lines
+        lines = [(x, top, right, top)]
+        lines.extend((x, row_bottom, right, row_bottom) for _, row_bottom, _ in fills)
+        lines.append((x, bottom, x, top))
+        lines.append((right, bottom, right, top))
+        inner_top = fills[0][1] if style.get("span_header") else top
+        lines.extend((line_x, bottom, line_x, inner_top) for line_x in col_x[1:-1])
+
+        return {
+            "x": x,
+            "width": right - x,
+            "col_x": col_x,
+            "fills": fills,
+            "lines": lines,
+            "grid": style["grid"],
+            "grid_width": style["grid_width"],
+            "text_rows": text_rows,
+            "right_align": style.get("right_align", False),
+        }
+
+    def _draw_table(self, c: "Canvas", template: Dict, rows: Sequence[Sequence[str]]):
+        """Draw a pre-laid-out table: replay its chrome, then fill in the cell text"""
+        x, width = template["x"], template["width"]
+        col_x = template["col_x"]
+        last_col = len(col_x) - 2
+
+        # Backgrounds
+        for fill, row_bottom, height in template["fills"]:
+            c.setFillColor(fill)
+            c.rect(x, row_bottom, width, height, stroke=0, fill=1)
+
+        # Grid
+        c.setStrokeColor(template["grid"])
+        c.setLineWidth(template["grid_width"])
+        c.lines(template["lines"])
+
+        # Cell text
+        right_align = template["right_align"]
+        for cells, (baseline, size, bold, text_color) in zip(rows, template["text_rows"]):
+            c.setFillColor(text_color)
+            for col, text in enumerate(cells):
+                if not text:
+                    continue
+                c.setFont('Helvetica-Bold' if col in bold else 'Helvetica', size)
+                if right_align and col == last_col:
+                    c.drawRightString(col_x[col + 1] - self._CELL_PADDING, baseline, text)
+                else:
+                    c.drawString(col_x[col] + self._CELL_PADDING, baseline, text)
+
+    def _draw_slip(self, c: "Canvas", slip_data: SalarySlipData, generated_on: str):
+        """Draw the salary slip onto the canvas"""
+        layout = self._LAYOUT
+        center_x = layout["center_x"]
+
+        # Title
+        c.setFont('Helvetica-Bold', 26)
+        c.setFillColor(C_TITLE)
+        c.drawCentredString(center_x, layout["title_y"], "SALARY SLIP")
+
+        # Company info
+        c.setFont('Helvetica', 10)
+        c.setFillColor(C_COMPANY)
+        c.drawCentredString(center_x, layout["company_y"][0], slip_data.company_name)
+        c.drawCentredString(center_x, layout["company_y"][1], slip_data.company_address)
+
+        # Pay Period: bold label followed by the dates, centred as one line
+        label_width = self._period_label_width
+        period_text = f" {slip_data.period.start_date} to {slip_data.period.end_date}"
+        start_x = center_x - (label_width + c.stringWidth(period_text, 'Helvetica', 11)) / 2
+        c.setFillColor(C_TEXT)
+        c.setFont('Helvetica-Bold', 11)
+        c.drawString(start_x, layout["period_y"], self._PERIOD_LABEL)
+        c.setFont('Helvetica', 11)
+        c.drawString(start_x + label_width, layout["period_y"], period_text)
+
+        # Employee Information
+        emp_data = [
+            ['EMPLOYEE INFORMATION', '', '', ''],
+            ['Employee ID:', slip_data.employee.employee_id, 'Department:', slip_data.employee.department],
+            ['Name:', slip_data.employee.name, 'Designation:', slip_data.employee.designation],
+            ['Email:', slip_data.employee.email, 'Bank Account:', slip_data.employee.bank_account],
+        ]
+        self._draw_table(c, self._templates["emp_table"], emp_data)
+
+        # Working Hours Summary
+        hours_data = [
+            ['WORKING HOURS SUMMARY', ''],
+            ['Regular Hours:', f"{slip_data.hours.regular_hours} hrs"],
+            ['Overtime Hours:', f"{slip_data.hours.overtime_hours} hrs"],
+            ['Leave Days:', f"{slip_data.hours.leave_days} days"],
+            ['Holiday Work Hours:', f"{slip_data.hours.holiday_work_hours} hrs"],
+        ]
+        self._draw_table(c, self._templates["hours_table"], hours_data)
+
+        # Earnings Breakdown
+        earnings_data = [
+            ['EARNINGS', 'AMOUNT'],
+            ['Base Pay', f"${slip_data.salary.gross_salary.base_pay:.2f}"],
+            ['Overtime Pay', f"${slip_data.salary.gross_salary.overtime_pay:.2f}"],
+            ['Allowances', f"${slip_data.salary.gross_salary.allowances:.2f}"],
+            ['Bonuses', f"${slip_data.salary.gross_salary.bonuses:.2f}"],
+            ['GROSS SALARY', f"${slip_data.salary.gross_salary.total_gross:.2f}"],
+        ]
+        self._draw_table(c, self._templates["earnings_table"], earnings_data)
+
+        # Deductions Breakdown
+        deductions_data = [
+            ['DEDUCTIONS', 'AMOUNT'],
+            ['Income Tax', f"${slip_data.salary.deductions.income_tax:.2f}"],
+            ['Social Security & Medicare', f"${slip_data.salary.deductions.social_security:.2f}"],
+            ['Insurance', f"${slip_data.salary.deductions.insurance:.2f}"],
+            ['Provident Fund', f"${slip_data.salary.deductions.provident_fund:.2f}"],
+            ['Other Deductions', f"${slip_data.salary.deductions.other_deductions:.2f}"],
+            ['TOTAL DEDUCTIONS', f"${slip_data.salary.deductions.total_deductions:.2f}"],
+        ]
+        self._draw_table(c, self._templates["deductions_table"], deductions_data)
+
+        # NET SALARY (Highlighted) and footer continue on the second page
+        c.showPage()
+        net_data = [
+            ['NET SALARY (TAKE HOME)', f"${slip_data.salary.net_salary:.2f}"],
+        ]
+        self._draw_table(c, self._templates["net_table"], net_data)
+
+        # Footer
+        c.setFont('Helvetica', 8)
+        c.setFillColor(C_FOOTER)
+        footer_lines = (
+            "This is a computer-generated salary slip and does not require a signature.",
+            f"Generated on: {generated_on}",
+            "For any queries, please contact the HR Department.",
+        )
+        for footer_y, text in zip(layout["footer_y"], footer_lines):
+            c.drawCentredString(center_x, footer_y, text)
+
+    def render_salary_slip_pdf(self, slip_data: SalarySlipData, generated_on: Optional[str] = None) -> bytes:
+        """Render the PDF salary slip into memory"""
+        from reportlab.pdfgen.canvas import Canvas
+
+        if generated_on is None:
+            generated_on = datetime.now().strftime(FOOTER_DATE_FORMAT)
+
+        # Draw the fixed layout straight onto an in-memory canvas
+        buffer = io.BytesIO()
+        c = Canvas(buffer, pagesize=letter)
+        self._draw_slip(c, slip_data, generated_on)
+        c.showPage()
+        c.save()
+        return buffer.getvalue()
+
+    def create_salary_slip_pdf(self, slip_data: SalarySlipData, output_path: Union[str, Path],
+                               generated_on: Optional[str] = None) -> bool:
         """Create the PDF salary slip"""
-        print(f"\n[{self.name}] Generating PDF salary slip...")
+        logger.debug("[%s] Generating PDF salary slip...", self.name)
 
         try:
-            # Create PDF document
-            pdf = SimpleDocTemplate(output_path, pagesize=letter)
-            story = []
-            styles = getSampleStyleSheet()
-
-            # Title
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=26,
-                textColor=colors.HexColor('#1a365d'),
-                spaceAfter=20,
-                alignment=1  # Center
-            )
-            story.append(Paragraph("SALARY SLIP", title_style))
-            story.append(Spacer(1, 0.2*inch))
-
-            # Company info
-            company_style = ParagraphStyle(
-                'Company',
-                parent=styles['Normal'],
-                fontSize=10,
-                textColor=colors.HexColor('#4a5568'),
-                alignment=1
-            )
-            story.append(Paragraph(slip_data.company_name, company_style))
-            story.append(Paragraph(slip_data.company_address, company_style))
-            story.append(Spacer(1, 0.3*inch))
-
-            # Pay Period
-            period_style = ParagraphStyle(
-                'Period',
-                parent=styles['Normal'],
-                fontSize=11,
-                alignment=1,
-                spaceAfter=10
-            )
-            period_text = f"<b>Pay Period:</b> {slip_data.period.start_date} to {slip_data.period.end_date}"
-            story.append(Paragraph(period_text, period_style))
-            story.append(Spacer(1, 0.2*inch))
-
-            # Employee Information
-            emp_data = [
-                ['EMPLOYEE INFORMATION', '', '', ''],
-                ['Employee ID:', slip_data.employee.employee_id, 'Department:', slip_data.employee.department],
-                ['Name:', slip_data.employee.name, 'Designation:', slip_data.employee.designation],
-                ['Email:', slip_data.employee.email, 'Bank Account:', slip_data.employee.bank_account],
-            ]
-
-            emp_table = Table(emp_data, colWidths=[1.3*inch, 2*inch, 1.3*inch, 2*inch])
-            emp_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2d3748')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
-                ('FONTNAME', (2, 1), (2, -1), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 1), (-1, -1), 9),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f7fafc')),
-                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#cbd5e0')),
-                ('SPAN', (0, 0), (-1, 0)),
-            ]))
-            story.append(emp_table)
-            story.append(Spacer(1, 0.3*inch))
-
-            # Working Hours Summary
-            hours_data = [
-                ['WORKING HOURS SUMMARY', ''],
-                ['Regular Hours:', f"{slip_data.hours.regular_hours} hrs"],
-                ['Overtime Hours:', f"{slip_data.hours.overtime_hours} hrs"],
-                ['Leave Days:', f"{slip_data.hours.leave_days} days"],
-                ['Holiday Work Hours:', f"{slip_data.hours.holiday_work_hours} hrs"],
-            ]
-
-            hours_table = Table(hours_data, colWidths=[3*inch, 2*inch])
-            hours_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c5282')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 11),
-                ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 1), (-1, -1), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#ebf8ff')),
-                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#4299e1')),
-                ('SPAN', (0, 0), (-1, 0)),
-            ]))
-            story.append(hours_table)
-            story.append(Spacer(1, 0.3*inch))
-
-            # Earnings Breakdown
-            earnings_data = [
-                ['EARNINGS', 'AMOUNT'],
-                ['Base Pay', f"${slip_data.salary.gross_salary.base_pay:.2f}"],
-                ['Overtime Pay', f"${slip_data.salary.gross_salary.overtime_pay:.2f}"],
-                ['Allowances', f"${slip_data.salary.gross_salary.allowances:.2f}"],
-                ['Bonuses', f"${slip_data.salary.gross_salary.bonuses:.2f}"],
-                ['GROSS SALARY', f"${slip_data.salary.gross_salary.total_gross:.2f}"],
-            ]
-
-            earnings_table = Table(earnings_data, colWidths=[3*inch, 2*inch])
-            earnings_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2d5016')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-                ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 11),
-                ('FONTSIZE', (0, 1), (-1, -2), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-                ('BACKGROUND', (0, 1), (-1, -2), colors.HexColor('#f0fff4')),
-                ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#68d391')),
-                ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, -1), (-1, -1), 11),
-                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#9ae6b4')),
-            ]))
-            story.append(earnings_table)
-            story.append(Spacer(1, 0.2*inch))
-
-            # Deductions Breakdown
-            deductions_data = [
-                ['DEDUCTIONS', 'AMOUNT'],
-                ['Income Tax', f"${slip_data.salary.deductions.income_tax:.2f}"],
-                ['Social Security & Medicare', f"${slip_data.salary.deductions.social_security:.2f}"],
-                ['Insurance', f"${slip_data.salary.deductions.insurance:.2f}"],
-                ['Provident Fund', f"${slip_data.salary.deductions.provident_fund:.2f}"],
-                ['Other Deductions', f"${slip_data.salary.deductions.other_deductions:.2f}"],
-                ['TOTAL DEDUCTIONS', f"${slip_data.salary.deductions.total_deductions:.2f}"],
-            ]
-
-            deductions_table = Table(deductions_data, colWidths=[3*inch, 2*inch])
-            deductions_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#742a2a')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-                ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 11),
-                ('FONTSIZE', (0, 1), (-1, -2), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-                ('BACKGROUND', (0, 1), (-1, -2), colors.HexColor('#fff5f5')),
-                ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#fc8181')),
-                ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, -1), (-1, -1), 11),
-                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#feb2b2')),
-            ]))
-            story.append(deductions_table)
-            story.append(Spacer(1, 0.3*inch))
-
-            # NET SALARY (Highlighted)
-            net_data = [
-                ['NET SALARY (TAKE HOME)', f"${slip_data.salary.net_salary:.2f}"],
-            ]
-
-            net_table = Table(net_data, colWidths=[3*inch, 2*inch])
-            net_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a365d')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (0, 0), 'LEFT'),
-                ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 14),
-                ('TOPPADDING', (0, 0), (-1, 0), 15),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 15),
-                ('GRID', (0, 0), (-1, -1), 2, colors.HexColor('#2c5282')),
-            ]))
-            story.append(net_table)
-            story.append(Spacer(1, 0.4*inch))
-
-            # Footer
-            footer_style = ParagraphStyle(
-                'Footer',
-                parent=styles['Normal'],
-                fontSize=8,
-                textColor=colors.HexColor('#718096'),
-                alignment=1
-            )
-            story.append(Paragraph("This is a computer-generated salary slip and does not require a signature.", footer_style))
-            story.append(Paragraph(f"Generated on: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}", footer_style))
-            story.append(Spacer(1, 0.1*inch))
-            story.append(Paragraph("For any queries, please contact the HR Department.", footer_style))
-
-            # Build PDF
-            pdf.build(story)
-            print(f"[{self.name}] ✓ PDF generated successfully: {output_path}")
+            _write_slip(Path(output_path), self.render_salary_slip_pdf(slip_data, generated_on))
+            logger.info("[%s] ✓ PDF generated successfully: %s", self.name, output_path)
 
             return True
 
         except Exception as e:
-            print(f"[{self.name}] ✗ Error generating PDF: {str(e)}")
+            logger.error("[%s] ✗ Error generating PDF: %s", self.name, e)
             return False
 
-    def process(self, timesheet_data: TimesheetData, salary_calculation: SalaryCalculation) -> Dict:
+    def prepare_slip(self, timesheet_data: TimesheetData, salary_calculation: SalaryCalculation) -> Tuple[SalarySlipData, Path]:
+        """Build the salary slip data object and its output path"""
+        # Create salary slip data object
+        slip_data = SalarySlipData(
+            employee=timesheet_data.employee,
+            period=timesheet_data.period,
+            hours=timesheet_data.hours,
+            salary=salary_calculation
+        )
+
+        # Generate filename
+        output_path = self.generate_filename(
+            timesheet_data.employee.employee_id,
+            timesheet_data.employee.name,
+            timesheet_data.period.end_date
+        )
+
+        return slip_data, output_path
+
+    def submit_slip(self, executor: Executor, timesheet_data: TimesheetData, salary_calculation: SalaryCalculation,
+                    generated_on: str) -> Tuple["Future[Optional[bytes]]", Path]:
+        """Start rendering a slip on a worker process pool; returns the render future and the slip's path"""
+        slip_data, output_path = self.prepare_slip(timesheet_data, salary_calculation)
+        return executor.submit(_render_slip, slip_data, output_path, generated_on), output_path
+
+    def save_slip(self, output_path: Path, pdf_bytes: Optional[bytes]) -> Dict:
+        """Write a slip rendered by submit_slip and build the generator result for it"""
+        if pdf_bytes is None:
+            return {"success": False, "file_path": None, "error": "Failed to generate PDF"}
+
+        try:
+            _write_slip(output_path, pdf_bytes)
+        except Exception as e:
+            logger.error("[%s] ✗ Error writing PDF %s: %s", self.name, output_path, e)
+            return {"success": False, "file_path": None, "error": str(e)}
+
+        return {"success": True, "file_path": output_path, "error": None}
+
+    def process(self, timesheet_data: TimesheetData, salary_calculation: SalaryCalculation,
+                now: Optional[datetime] = None) -> Dict:
         """Main processing method - generates salary slip PDF"""
-        print(f"\n{'='*60}")
-        print(f"[{self.name}] Starting PDF generation")
-        print(f"{'='*60}")
+        logger.debug("[%s] Starting PDF generation", self.name)
 
         try:
-            # Create salary slip data object
-            slip_data = SalarySlipData(
-                employee=timesheet_data.employee,
-                period=timesheet_data.period,
-                hours=timesheet_data.hours,
-                salary=salary_calculation
-            )
-
-            # Generate filename
-            output_path = self.generate_filename(
-                timesheet_data.employee.employee_id,
-                timesheet_data.employee.name,
-                timesheet_data.period.end_date
-            )
+            slip_data, output_path = self.prepare_slip(timesheet_data, salary_calculation)
 
             # Create PDF
-            success = self.create_salary_slip_pdf(slip_data, output_path)
+            generated_on = (now or datetime.now()).strftime(FOOTER_DATE_FORMAT)
+            success = self.create_salary_slip_pdf(slip_data, output_path, generated_on)
 
             if success:
                 return {
@@ -275,18 +398,72 @@ class SalarySlipGeneratorAgent:
                 }
 
         except Exception as e:
-            print(f"\n[{self.name}] ✗ Error during PDF generation: {str(e)}")
+            logger.error("[%s] ✗ Error during PDF generation: %s", self.name, e)
             return {
                 "success": False,
                 "file_path": None,
                 "error": str(e)
             }
 
+    def process_batch(self, pairs: List[Tuple[TimesheetData, SalaryCalculation]],
+                      max_workers: Optional[int] = None, now: Optional[datetime] = None) -> List[Dict]:
+        """Generate salary slip PDFs for many employees in parallel worker processes"""
+        logger.info("[%s] Generating %d salary slips in batch", self.name, len(pairs))
+
+        # Every slip in the batch carries the same footer timestamp, formatted once
+        generated_on = (now or datetime.now()).strftime(FOOTER_DATE_FORMAT)
+
+        # Workers render PDFs in memory; each one is handed to the I/O threads as soon
+        # as it arrives so disk writes overlap with the slips still rendering
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor, \
+                ThreadPoolExecutor(max_workers=IO_WRITER_THREADS) as io_pool:
+            renders = [
+                self.submit_slip(executor, timesheet_data, salary_calculation, generated_on)
+                for timesheet_data, salary_calculation in pairs
+            ]
+            writes = [io_pool.submit(self.save_slip, output_path, render.result()) for render, output_path in renders]
+
+        return [write.result() for write in writes]
+
+
+def _write_slip(output_path: Path, pdf_bytes: bytes):
+    """Write a PDF to a temporary file beside output_path, then rename it into place
+
+    Concurrent runs can produce the same slip filename; the rename means a reader
+    only ever sees one complete PDF, never a mix of two writes.
+    """
+    temp_path = output_path.with_name(f".{output_path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        temp_path.write_bytes(pdf_bytes)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+# Agent instance reused by each batch worker process
+_worker_agent = None
+
+
+def _render_slip(slip_data: SalarySlipData, output_path: Path, generated_on: str) -> Optional[bytes]:
+    """Render a single salary slip inside a batch worker process"""
+    global _worker_agent
+    if _worker_agent is None:
+        _worker_agent = SalarySlipGeneratorAgent(output_path.parent)
+
+    try:
+        return _worker_agent.render_salary_slip_pdf(slip_data, generated_on)
+    except Exception as e:
+        logger.error("[%s] ✗ Error generating PDF %s: %s", _worker_agent.name, output_path, e)
+        return None
+
 
 # Test function
 if __name__ == "__main__":
     from models import EmployeeInfo, WorkingHours, PayPeriod, GrossSalary, Deductions
 
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+
     # Create sample data
     sample_timesheet = TimesheetData(
         employee=EmployeeInfo(
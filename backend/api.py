@@ -2,20 +2,32 @@
 FastAPI Backend for Agentic Payroll System
 Provides REST API endpoints for frontend integration
 """
-from fastapi import FastAPI, File, UploadFile, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, FastAPI, File, UploadFile, HTTPException, Query, Request
+from fastapi.responses import FileResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
-import shutil
+from fastapi.routing import APIRoute
+from starlette.datastructures import FormData
+from starlette.formparsers import MultiPartException, MultiPartParser
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+import aiofiles
+import asyncio
+import orjson
+import gc
+import hashlib
 import os
+import re
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 import sys
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from workflow import create_workflow
-from models import AgentState
+from workflow import create_workflow, create_initial_state
 
 app = FastAPI(title="Agentic Payroll API", version="1.0.0")
 
@@ -33,6 +45,139 @@ SALARY_SLIP_DIR = Path("salary_slips")
 TIMESHEET_DIR.mkdir(parents=True, exist_ok=True)
 SALARY_SLIP_DIR.mkdir(parents=True, exist_ok=True)
 
+# Uploads are copied to disk in 1 MiB chunks; .xlsx files are zip archives
+UPLOAD_CHUNK_SIZE = 1 << 20
+XLSX_MAGIC = b"PK\x03\x04"
+
+# Timesheet uploads up to PAYROLL_UPLOAD_SPOOL_SIZE bytes (default 8 MiB) stay in
+# memory instead of spilling to a temp file
+UPLOAD_SPOOL_SIZE = int(os.getenv("PAYROLL_UPLOAD_SPOOL_SIZE", 8 << 20))
+
+
+class UploadParser(MultiPartParser):
+    """MultiPartParser that keeps uploads up to UPLOAD_SPOOL_SIZE in memory"""
+    spool_max_size = UPLOAD_SPOOL_SIZE
+
+
+class UploadRequest(Request):
+    """Request that parses multipart bodies with UploadParser instead of Starlette's default"""
+
+    async def _get_form(self, **kwargs) -> FormData:
+        # Fill in the form Starlette would otherwise parse itself; other content types are left to it
+        if self._form is None and self.headers.get("content-type", "").startswith("multipart/form-data"):
+            try:
+                self._form = await UploadParser(self.headers, self.stream(), **kwargs).parse()
+            except MultiPartException as exc:
+                raise HTTPException(status_code=400, detail=exc.message)
+        return await super()._get_form(**kwargs)
+
+
+class UploadRoute(APIRoute):
+    """Route that hands its endpoint an UploadRequest, so only upload routes use UploadParser"""
+
+    def get_route_handler(self):
+        route_handler = super().get_route_handler()
+
+        async def upload_route_handler(request: Request) -> Response:
+            return await route_handler(UploadRequest(request.scope, request.receive))
+
+        return upload_route_handler
+
+
+upload_router = APIRouter(route_class=UploadRoute)
+
+
+class PDFFileResponse(FileResponse):
+    """FileResponse that streams salary slips in 1 MiB chunks instead of 64 KiB"""
+    chunk_size = 1 << 20
+
+
+# Worker threads that run timesheet workflows concurrently
+EXECUTOR = ThreadPoolExecutor(max_workers=int(os.getenv("PAYROLL_CONCURRENCY", 8)))
+
+# Salary slips from completed runs, keyed by (timesheet filename, sha256 of its contents);
+# each entry keeps the slip's path with the mtime and size it was written with
+RESULT_CACHE_SIZE = 1024
+_RESULT_CACHE: "OrderedDict[Tuple[str, str], Tuple[Path, int, int]]" = OrderedDict()
+_RESULT_CACHE_LOCK = threading.Lock()
+
+# Salary slip filenames: <employee id>_<name with underscores>_SalarySlip_<period end>
+_NAME_RE = re.compile(r"^([^_]+)_(.+)_[^_]+_[^_]+$")
+
+# Entity tags in an If-None-Match header: "*" or a quoted tag, optionally weak (W/"...")
+_ETAG_RE = re.compile(r'\*|(?:W/)?"[^"]*"')
+
+# Run a full garbage collection after each /api/process batch when set
+GC_AFTER_BATCH = os.getenv("PAYROLL_GC_AFTER_BATCH", "").lower() in ("1", "true", "yes")
+
+
+@lru_cache(maxsize=1)
+def _get_workflow():
+    """Build the workflow and its agents once and reuse them for every request"""
+    return create_workflow()
+
+
+# Build at startup so the first request does not pay for graph compilation
+_get_workflow()
+
+
+def _file_digest(path: str) -> str:
+    """Hash a file's contents with SHA-256"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(UPLOAD_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _slip_signature(salary_slip_path: Path) -> Optional[Tuple[Path, int, int]]:
+    """Return a slip's path with its current mtime and size, or None if it is gone"""
+    try:
+        stat_result = os.stat(salary_slip_path)
+    except OSError:
+        return None
+    return salary_slip_path, stat_result.st_mtime_ns, stat_result.st_size
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag using the weak comparison it calls for"""
+    tags = _ETAG_RE.findall(if_none_match)
+    if "*" in tags:
+        return True
+    opaque_tag = etag[2:] if etag.startswith("W/") else etag
+    return any((tag[2:] if tag.startswith("W/") else tag) == opaque_tag for tag in tags)
+
+
+def _run_workflow(workflow, timesheet_file: os.DirEntry, force: bool) -> Dict:
+    """Run the workflow for one timesheet, reusing the slip from an earlier run on identical contents"""
+    # A forced run neither reads nor refreshes the cache, so it skips hashing the timesheet;
+    # the slip it rewrites no longer matches any older entry's signature
+    if force:
+        return workflow.invoke(create_initial_state(timesheet_file.path))
+
+    key = (timesheet_file.name, _file_digest(timesheet_file.path))
+    with _RESULT_CACHE_LOCK:
+        entry = _RESULT_CACHE.get(key)
+        if entry is not None:
+            _RESULT_CACHE.move_to_end(key)
+    # Slip filenames come from the employee and period, so another upload may
+    # have overwritten the slip since; only reuse it if it is unchanged on disk
+    if entry is not None and _slip_signature(entry[0]) == entry:
+        return {"workflow_status": "completed", "salary_slip_path": entry[0]}
+
+    final_state = workflow.invoke(create_initial_state(timesheet_file.path))
+
+    if final_state.get("workflow_status") == "completed":
+        entry = _slip_signature(final_state["salary_slip_path"])
+        if entry is not None:
+            with _RESULT_CACHE_LOCK:
+                _RESULT_CACHE[key] = entry
+                _RESULT_CACHE.move_to_end(key)
+                if len(_RESULT_CACHE) > RESULT_CACHE_SIZE:
+                    _RESULT_CACHE.popitem(last=False)
+
+    return final_state
+
 
 @app.get("/")
 async def root():
@@ -48,16 +193,23 @@ async def root():
     }
 
 
-@app.post("/api/upload")
+@upload_router.post("/api/upload")
 async def upload_timesheet(file: UploadFile = File(...)):
     """Upload a timesheet Excel file"""
     if not file.filename.endswith(".xlsx"):
         raise HTTPException(status_code=400, detail="Only Excel files (.xlsx) are allowed")
-    
+
+    # Check the content, not just the filename
+    chunk = await file.read(UPLOAD_CHUNK_SIZE)
+    if not chunk.startswith(XLSX_MAGIC):
+        raise HTTPException(status_code=400, detail="Uploaded file is not a valid Excel workbook")
+
     try:
         file_path = TIMESHEET_DIR / file.filename
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        async with aiofiles.open(file_path, "wb") as buffer:
+            while chunk:
+                await buffer.write(chunk)
+                chunk = await file.read(UPLOAD_CHUNK_SIZE)
         
         return {
             "message": "File uploaded successfully",
@@ -68,11 +220,18 @@ async def upload_timesheet(file: UploadFile = File(...)):
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
 
+app.include_router(upload_router)
+
+
 @app.post("/api/process")
-async def process_timesheets():
-    """Process all timesheets and generate salary slips"""
+async def process_timesheets(force: bool = False):
+    """Process all timesheets and generate salary slips; pass force=true to ignore cached results"""
     try:
-        timesheet_files = list(TIMESHEET_DIR.glob("*.xlsx"))
+        with os.scandir(TIMESHEET_DIR) as entries:
+            timesheet_files = sorted(
+                (entry for entry in entries if entry.name.endswith(".xlsx") and entry.is_file()),
+                key=lambda entry: entry.name
+            )
         
         if not timesheet_files:
             return {
@@ -82,46 +241,55 @@ async def process_timesheets():
                 "failed": 0
             }
         
-        workflow = create_workflow()
+        workflow = _get_workflow()
         successful = 0
         failed = 0
-        results = []
-        
-        for timesheet_file in timesheet_files:
-            try:
-                initial_state = AgentState(
-                    timesheet_file_path=str(timesheet_file),
-                    timesheet_data=None,
-                    extraction_status="pending",
-                    calculation_status="pending",
-                    pdf_generation_status="pending",
-                    error_message=None
-                )
-                
-                final_state = workflow.invoke(initial_state)
-                
-                if final_state.get("pdf_generation_status") == "success":
-                    successful += 1
-                    results.append({
-                        "file": timesheet_file.name,
-                        "status": "success"
-                    })
-                else:
-                    failed += 1
-                    results.append({
-                        "file": timesheet_file.name,
-                        "status": "failed",
-                        "error": final_state.get("error_message")
-                    })
-                    
-            except Exception as e:
+        results = [None] * len(timesheet_files)
+
+        # Each timesheet is independent, so run the workflows side by side
+        loop = asyncio.get_running_loop()
+        final_states = await asyncio.gather(
+            *[
+                loop.run_in_executor(EXECUTOR, _run_workflow, workflow, timesheet_file, force)
+                for timesheet_file in timesheet_files
+            ],
+            return_exceptions=True
+        )
+
+        for idx, (timesheet_file, final_state) in enumerate(zip(timesheet_files, final_states)):
+            if isinstance(final_state, Exception):
                 failed += 1
-                results.append({
+                results[idx] = {
                     "file": timesheet_file.name,
                     "status": "failed",
-                    "error": str(e)
-                })
-        
+                    "error": str(final_state)
+                }
+            elif final_state.get("workflow_status") == "completed":
+                successful += 1
+                results[idx] = {
+                    "file": timesheet_file.name,
+                    "status": "success"
+                }
+            else:
+                failed += 1
+                results[idx] = {
+                    "file": timesheet_file.name,
+                    "status": "failed",
+                    "error": (
+                        final_state.get("extraction_error")
+                        or final_state.get("calculation_error")
+                        or final_state.get("generation_error")
+                    )
+                }
+
+            # Drop the parsed timesheet and calculation as soon as the result is recorded
+            if isinstance(final_state, dict):
+                final_state.clear()
+
+        del final_states, final_state
+        if GC_AFTER_BATCH:
+            gc.collect()
+
         return {
             "message": f"Processed {len(timesheet_files)} timesheets: {successful} successful, {failed} failed",
             "total_processed": len(timesheet_files),
@@ -134,40 +302,55 @@ async def process_timesheets():
         raise HTTPException(status_code=500, detail=f"Processing failed: {str(e)}")
 
 
+# Handlers that only do blocking filesystem work are plain functions so
+# Starlette runs them in its threadpool instead of on the event loop
 @app.get("/api/salary-slips")
-async def list_salary_slips():
-    """List all generated salary slips"""
+def list_salary_slips(limit: Optional[int] = Query(None, ge=0)):
+    """List generated salary slips, newest first; limit caps how many entries are returned"""
     try:
+        # scandir hands back each entry's stat without an extra syscall per file
+        entries = []
+        with os.scandir(SALARY_SLIP_DIR) as it:
+            for entry in it:
+                if entry.name.endswith(".pdf") and entry.is_file():
+                    stat = entry.stat()
+                    entries.append((entry.name, stat.st_mtime, stat.st_size))
+
+        # Sort on the raw mtime and only build entries for the slips being returned
+        entries.sort(key=itemgetter(1), reverse=True)
+
         salary_slips = []
-        
-        for pdf_file in SALARY_SLIP_DIR.glob("*.pdf"):
-            stat = pdf_file.stat()
-            parts = pdf_file.stem.split("_")
-            
-            employee_id = parts[0] if parts else "Unknown"
-            employee_name = " ".join(parts[1:-2]) if len(parts) > 2 else "Unknown"
-            
+        for name, mtime, size in entries[:limit]:
+            stem = name[:-len(".pdf")]
+            match = _NAME_RE.match(stem)
+            if match:
+                employee_id, employee_name = match.group(1), match.group(2).replace("_", " ")
+            else:
+                employee_id, employee_name = stem.partition("_")[0] or "Unknown", "Unknown"
+
             salary_slips.append({
-                "filename": pdf_file.name,
+                "filename": name,
                 "employee_id": employee_id,
                 "employee_name": employee_name,
-                "created_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                "size": stat.st_size
+                "created_at": datetime.fromtimestamp(mtime).isoformat(),
+                "size": size
             })
-        
-        salary_slips.sort(key=lambda x: x["created_at"], reverse=True)
-        
-        return {
-            "total": len(salary_slips),
-            "salary_slips": salary_slips
-        }
+
+        # Already plain JSON types, so skip jsonable_encoder and serialize with orjson
+        return Response(
+            orjson.dumps({
+                "total": len(entries),
+                "salary_slips": salary_slips
+            }),
+            media_type="application/json"
+        )
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list salary slips: {str(e)}")
 
 
 @app.get("/api/salary-slips/{filename}")
-async def download_salary_slip(filename: str):
+def download_salary_slip(filename: str, request: Request):
     """Download a specific salary slip PDF"""
     file_path = SALARY_SLIP_DIR / filename
     
@@ -177,15 +360,26 @@ async def download_salary_slip(filename: str):
     if not file_path.is_file() or not file_path.suffix == ".pdf":
         raise HTTPException(status_code=400, detail="Invalid file")
     
-    return FileResponse(
+    response = PDFFileResponse(
         path=file_path,
         media_type="application/pdf",
-        filename=filename
+        filename=filename,
+        stat_result=file_path.stat()
     )
 
+    # The ETag and Last-Modified headers come from the file's stat; answer 304 if the client copy is current
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, response.headers["etag"]):
+        return Response(
+            status_code=304,
+            headers={"etag": response.headers["etag"], "last-modified": response.headers["last-modified"]}
+        )
+
+    return response
+
 
 @app.delete("/api/salary-slips/{filename}")
-async def delete_salary_slip(filename: str):
+def delete_salary_slip(filename: str):
     """Delete a specific salary slip"""
     file_path = SALARY_SLIP_DIR / filename
     
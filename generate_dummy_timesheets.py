@@ -1,6 +1,7 @@
-import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-import random
+import numpy as np
+import xlsxwriter
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -121,141 +122,238 @@ employees = [
 pay_period_start = datetime(2025, 10, 1)
 pay_period_end = datetime(2025, 10, 31)
 
-def generate_daily_attendance(employee):
-    """Generate daily attendance for an employee for the month"""
-    daily_records = []
-    current_date = pay_period_start
-
-    while current_date <= pay_period_end:
-        day_of_week = current_date.weekday()
-
-        # Skip weekends (Saturday=5, Sunday=6)
-        if day_of_week >= 5:
-            daily_records.append({
-                "date": current_date.strftime("%Y-%m-%d"),
-                "day": current_date.strftime("%A"),
-                "status": "Weekend",
-                "hours_worked": 0,
-                "overtime_hours": 0,
-                "notes": ""
-            })
-        else:
-            # Random scenarios for realistic data
-            scenario = random.choices(
-                ["normal", "overtime", "half_day", "leave", "holiday"],
-                weights=[70, 15, 5, 8, 2],
-                k=1
-            )[0]
-
-            if scenario == "normal":
-                hours = 8
-                overtime = 0
-                status = "Present"
-                notes = ""
-            elif scenario == "overtime":
-                hours = 8
-                overtime = random.choice([1, 2, 3, 4])
-                status = "Present"
-                notes = f"Overtime: {overtime}h"
-            elif scenario == "half_day":
-                hours = 4
-                overtime = 0
-                status = "Half Day"
-                notes = "Personal work"
-            elif scenario == "leave":
-                hours = 0
-                overtime = 0
-                status = "Leave"
-                notes = random.choice(["Sick Leave", "Casual Leave", "Personal Leave"])
-            else:  # holiday
-                hours = 8
-                overtime = 0
-                status = "Holiday Work"
-                notes = "Public Holiday - Extra Pay"
-
-            daily_records.append({
-                "date": current_date.strftime("%Y-%m-%d"),
-                "day": current_date.strftime("%A"),
-                "status": status,
-                "hours_worked": hours,
-                "overtime_hours": overtime,
-                "notes": notes
-            })
-
-        current_date += timedelta(days=1)
-
-    return daily_records
-
-def create_excel_timesheet(employee, daily_records):
+# Layout of the Excel timesheet: the period table starts on row 8 and the daily
+# records on row 13 (0-based); the summary follows two blank rows after the last day
+PERIOD_INFO_ROW = 8
+DAILY_RECORDS_ROW = 13
+SUMMARY_GAP_ROWS = 2
+DAILY_COLUMNS = ("date", "day", "status", "hours_worked", "overtime_hours", "notes")
+
+# Daily attendance statuses, indexed by their integer status code
+STATUS_WEEKEND, STATUS_PRESENT, STATUS_HALF_DAY, STATUS_LEAVE, STATUS_HOLIDAY_WORK = range(5)
+STATUS_NAMES = ("Weekend", "Present", "Half Day", "Leave", "Holiday Work")
+
+# Base seed for the attendance draws; each employee gets its own child stream
+RANDOM_SEED = 20251001
+
+# Weekday scenarios (normal, overtime, half day, leave, holiday work): how likely
+# each one is and the status, hours and note it produces
+SCENARIO_PROBABILITIES = (0.70, 0.15, 0.05, 0.08, 0.02)
+SCENARIO_OVERTIME, SCENARIO_LEAVE = 1, 3
+SCENARIO_STATUS = np.array([STATUS_PRESENT, STATUS_PRESENT, STATUS_HALF_DAY, STATUS_LEAVE, STATUS_HOLIDAY_WORK], dtype=np.int8)
+SCENARIO_HOURS = np.array([8, 8, 4, 0, 8], dtype=np.int8)
+SCENARIO_NOTES = np.array(["", "", "Personal work", "", "Public Holiday - Extra Pay"], dtype=object)
+OVERTIME_NOTES = np.array(["", "Overtime: 1h", "Overtime: 2h", "Overtime: 3h", "Overtime: 4h"], dtype=object)
+LEAVE_NOTES = np.array(["Sick Leave", "Casual Leave", "Personal Leave"], dtype=object)
+
+# PDF colours and styles, built once and shared by every employee's timesheet
+HEX_TITLE = colors.HexColor('#1a365d')
+HEX_COMPANY = colors.HexColor('#4a5568')
+HEX_TABLE_HEADER = colors.HexColor('#2d3748')
+HEX_TABLE_BG = colors.HexColor('#f7fafc')
+HEX_TABLE_GRID = colors.HexColor('#cbd5e0')
+HEX_SUMMARY_HEADER = colors.HexColor('#2c5282')
+HEX_SUMMARY_BG = colors.HexColor('#ebf8ff')
+HEX_SUMMARY_GRID = colors.HexColor('#4299e1')
+HEX_FOOTER = colors.HexColor('#718096')
+
+STYLES = getSampleStyleSheet()
+
+# Table column widths
+INFO_COL_WIDTHS = (2*inch, 4*inch)
+ATTENDANCE_COL_WIDTHS = (1*inch, 0.6*inch, 1*inch, 0.6*inch, 0.5*inch, 2.3*inch)
+SUMMARY_COL_WIDTHS = (2.5*inch, 2*inch)
+
+TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=STYLES['Heading1'],
+    fontSize=24,
+    textColor=HEX_TITLE,
+    spaceAfter=30,
+    alignment=1  # Center
+)
+
+COMPANY_STYLE = ParagraphStyle(
+    'Company',
+    parent=STYLES['Normal'],
+    fontSize=10,
+    textColor=HEX_COMPANY,
+    alignment=1
+)
+
+FOOTER_STYLE = ParagraphStyle(
+    'Footer',
+    parent=STYLES['Normal'],
+    fontSize=8,
+    textColor=HEX_FOOTER,
+    alignment=1
+)
+
+# Employee information and pay period tables share one style
+INFO_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), HEX_TABLE_HEADER),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), HEX_TABLE_BG),
+    ('GRID', (0, 0), (-1, -1), 1, HEX_TABLE_GRID),
+    ('SPAN', (0, 0), (-1, 0)),
+])
+
+ATTENDANCE_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), HEX_TABLE_HEADER),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('FONTSIZE', (0, 1), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+    ('GRID', (0, 0), (-1, -1), 0.5, HEX_TABLE_GRID),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, HEX_TABLE_BG]),
+])
+
+SUMMARY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), HEX_SUMMARY_HEADER),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), HEX_SUMMARY_BG),
+    ('GRID', (0, 0), (-1, -1), 1, HEX_SUMMARY_GRID),
+    ('SPAN', (0, 0), (-1, 0)),
+])
+
+def generate_daily_attendance(employee, rng=None):
+    """Generate daily attendance for an employee for the month as parallel per-day arrays, plus its summary"""
+    if rng is None:
+        rng = np.random.default_rng()
+
+    n_days = (pay_period_end - pay_period_start).days + 1
+    dates = [pay_period_start + timedelta(days=offset) for offset in range(n_days)]
+
+    # Skip weekends (Saturday=5, Sunday=6)
+    weekdays = (pay_period_start.weekday() + np.arange(n_days)) % 7 < 5
+    n_weekdays = int(np.count_nonzero(weekdays))
+
+    # Random scenarios for realistic data, drawn for every weekday at once
+    scenarios = rng.choice(len(SCENARIO_PROBABILITIES), size=n_weekdays, p=SCENARIO_PROBABILITIES)
+    overtime_hours = np.where(scenarios == SCENARIO_OVERTIME, rng.integers(1, 5, size=n_weekdays), 0)
+    leave_kinds = rng.integers(0, len(LEAVE_NOTES), size=n_weekdays)
+
+    status_codes = np.full(n_days, STATUS_WEEKEND, dtype=np.int8)
+    hours = np.zeros(n_days, dtype=np.int8)
+    overtime = np.zeros(n_days, dtype=np.int8)
+    status_codes[weekdays] = SCENARIO_STATUS[scenarios]
+    hours[weekdays] = SCENARIO_HOURS[scenarios]
+    overtime[weekdays] = overtime_hours
+
+    weekday_notes = SCENARIO_NOTES[scenarios]
+    weekday_notes[scenarios == SCENARIO_OVERTIME] = OVERTIME_NOTES[overtime_hours[scenarios == SCENARIO_OVERTIME]]
+    weekday_notes[scenarios == SCENARIO_LEAVE] = LEAVE_NOTES[leave_kinds[scenarios == SCENARIO_LEAVE]]
+    notes = np.full(n_days, "", dtype=object)
+    notes[weekdays] = weekday_notes
+
+    attendance = {
+        "date": [current_date.strftime("%Y-%m-%d") for current_date in dates],
+        "day": [current_date.strftime("%A") for current_date in dates],
+        "status": status_codes,
+        "hours_worked": hours,
+        "overtime_hours": overtime,
+        "notes": notes.tolist()
+    }
+    return attendance, summarize_attendance(attendance)
+
+def summarize_attendance(attendance):
+    """Total the attendance arrays into the timesheet summary figures"""
+    status_codes = attendance["status"]
+    hours = attendance["hours_worked"]
+    return {
+        "total_regular_hours": int(hours[(status_codes == STATUS_PRESENT) | (status_codes == STATUS_HALF_DAY)].sum()),
+        "total_overtime_hours": int(attendance["overtime_hours"].sum()),
+        "total_leave_days": int(np.count_nonzero(status_codes == STATUS_LEAVE)),
+        "holiday_work_hours": int(hours[status_codes == STATUS_HOLIDAY_WORK].sum())
+    }
+
+def attendance_rows(attendance):
+    """Convert the attendance arrays into (date, day, status, hours, overtime, notes) rows"""
+    return list(zip(
+        attendance["date"],
+        attendance["day"],
+        [STATUS_NAMES[code] for code in attendance["status"].tolist()],
+        attendance["hours_worked"].tolist(),
+        attendance["overtime_hours"].tolist(),
+        attendance["notes"]
+    ))
+
+def create_excel_timesheet(employee, attendance, totals):
     """Create Excel timesheet for an employee"""
 
-    # Create employee info section
-    employee_info = pd.DataFrame({
-        "Field": ["Employee ID", "Name", "Department", "Designation", "Email", "Bank Account"],
-        "Value": [
-            employee["employee_id"],
-            employee["name"],
-            employee["department"],
-            employee["designation"],
-            employee["email"],
-            employee["bank_account"]
-        ]
-    })
-
-    # Create period info
-    period_info = pd.DataFrame({
-        "Field": ["Pay Period Start", "Pay Period End"],
-        "Value": [pay_period_start.strftime("%Y-%m-%d"), pay_period_end.strftime("%Y-%m-%d")]
-    })
-
-    # Create daily attendance dataframe
-    df_daily = pd.DataFrame(daily_records)
-
-    # Calculate summary
-    total_regular_hours = df_daily[df_daily['status'].isin(['Present', 'Half Day'])]['hours_worked'].sum()
-    total_overtime_hours = df_daily['overtime_hours'].sum()
-    total_leave_days = len(df_daily[df_daily['status'] == 'Leave'])
-    holiday_work_hours = df_daily[df_daily['status'] == 'Holiday Work']['hours_worked'].sum()
-
-    summary = pd.DataFrame({
-        "Metric": [
-            "Total Regular Hours",
-            "Total Overtime Hours",
-            "Total Leave Days",
-            "Holiday Work Hours",
-            "Hourly Rate ($)",
-            "Overtime Rate ($)"
-        ],
-        "Value": [
-            total_regular_hours,
-            total_overtime_hours,
-            total_leave_days,
-            holiday_work_hours,
-            employee["hourly_rate"],
-            employee["overtime_rate"]
-        ]
-    })
-
-    # Create Excel file with multiple sheets
+    # Employee info section
+    employee_info = [
+        ("Employee ID", employee["employee_id"]),
+        ("Name", employee["name"]),
+        ("Department", employee["department"]),
+        ("Designation", employee["designation"]),
+        ("Email", employee["email"]),
+        ("Bank Account", employee["bank_account"]),
+    ]
+
+    # Period info
+    period_info = [
+        ("Pay Period Start", pay_period_start.strftime("%Y-%m-%d")),
+        ("Pay Period End", pay_period_end.strftime("%Y-%m-%d")),
+    ]
+
+    summary = [
+        ("Total Regular Hours", totals["total_regular_hours"]),
+        ("Total Overtime Hours", totals["total_overtime_hours"]),
+        ("Total Leave Days", totals["total_leave_days"]),
+        ("Holiday Work Hours", totals["holiday_work_hours"]),
+        ("Hourly Rate ($)", employee["hourly_rate"]),
+        ("Overtime Rate ($)", employee["overtime_rate"]),
+    ]
+
+    # Create Excel file; constant_memory streams each row to disk once the next one starts
     filename = f"timesheets/excel/{employee['employee_id']}_{employee['name'].replace(' ', '_')}_Timesheet_Oct2025.xlsx"
 
-    with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-        # Write employee info
-        employee_info.to_excel(writer, sheet_name='Timesheet', index=False, startrow=0)
+    wb = xlsxwriter.Workbook(filename, {"constant_memory": True})
+    ws = wb.add_worksheet("Timesheet")
+
+    # Write employee info
+    ws.write_row(0, 0, ("Field", "Value"))
+    for row_idx, row in enumerate(employee_info, 1):
+        ws.write_row(row_idx, 0, row)
 
-        # Write period info
-        period_info.to_excel(writer, sheet_name='Timesheet', index=False, startrow=len(employee_info) + 2)
+    # Write period info
+    ws.write_row(PERIOD_INFO_ROW, 0, ("Field", "Value"))
+    for row_idx, row in enumerate(period_info, PERIOD_INFO_ROW + 1):
+        ws.write_row(row_idx, 0, row)
 
-        # Write daily records
-        df_daily.to_excel(writer, sheet_name='Timesheet', index=False, startrow=len(employee_info) + len(period_info) + 5)
+    # Write daily records
+    ws.write_row(DAILY_RECORDS_ROW, 0, DAILY_COLUMNS)
+    row_idx = DAILY_RECORDS_ROW
+    for row_idx, row in enumerate(attendance_rows(attendance), DAILY_RECORDS_ROW + 1):
+        ws.write_row(row_idx, 0, row)
 
-        # Write summary
-        summary.to_excel(writer, sheet_name='Timesheet', index=False, startrow=len(employee_info) + len(period_info) + len(df_daily) + 8)
+    # Write summary
+    summary_row = row_idx + SUMMARY_GAP_ROWS + 1
+    ws.write_row(summary_row, 0, ("Metric", "Value"))
+    for row_idx, row in enumerate(summary, summary_row + 1):
+        ws.write_row(row_idx, 0, row)
+
+    wb.close()
 
     print(f"Created Excel: {filename}")
     return filename
 
-def create_pdf_timesheet(employee, daily_records):
+def create_pdf_timesheet(employee, attendance, totals):
     """Create PDF timesheet for an employee"""
 
     filename = f"timesheets/pdf/{employee['employee_id']}_{employee['name'].replace(' ', '_')}_Timesheet_Oct2025.pdf"
@@ -263,31 +361,15 @@ def create_pdf_timesheet(employee, daily_records):
     # Create PDF
     pdf = SimpleDocTemplate(filename, pagesize=letter)
     story = []
-    styles = getSampleStyleSheet()
 
     # Title
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=colors.HexColor('#1a365d'),
-        spaceAfter=30,
-        alignment=1  # Center
-    )
-    story.append(Paragraph("EMPLOYEE TIMESHEET", title_style))
+    story.append(Paragraph("EMPLOYEE TIMESHEET", TITLE_STYLE))
     story.append(Spacer(1, 0.3*inch))
 
     # Company info
-    company_style = ParagraphStyle(
-        'Company',
-        parent=styles['Normal'],
-        fontSize=10,
-        textColor=colors.HexColor('#4a5568'),
-        alignment=1
-    )
-    story.append(Paragraph("TechCorp Industries Inc.", company_style))
-    story.append(Paragraph("123 Business Avenue, San Francisco, CA 94102", company_style))
-    story.append(Paragraph("Phone: (555) 123-4567 | Email: payroll@techcorp.com", company_style))
+    story.append(Paragraph("TechCorp Industries Inc.", COMPANY_STYLE))
+    story.append(Paragraph("123 Business Avenue, San Francisco, CA 94102", COMPANY_STYLE))
+    story.append(Paragraph("Phone: (555) 123-4567 | Email: payroll@techcorp.com", COMPANY_STYLE))
     story.append(Spacer(1, 0.3*inch))
 
     # Employee Information Table
@@ -301,20 +383,8 @@ def create_pdf_timesheet(employee, daily_records):
         ['Bank Account:', employee['bank_account']],
     ]
 
-    employee_table = Table(employee_data, colWidths=[2*inch, 4*inch])
-    employee_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2d3748')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f7fafc')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#cbd5e0')),
-        ('SPAN', (0, 0), (-1, 0)),
-    ]))
+    employee_table = Table(employee_data, colWidths=INFO_COL_WIDTHS)
+    employee_table.setStyle(INFO_TABLE_STYLE)
     story.append(employee_table)
     story.append(Spacer(1, 0.2*inch))
 
@@ -325,98 +395,50 @@ def create_pdf_timesheet(employee, daily_records):
         ['End Date:', pay_period_end.strftime("%B %d, %Y")],
     ]
 
-    period_table = Table(period_data, colWidths=[2*inch, 4*inch])
-    period_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2d3748')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f7fafc')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#cbd5e0')),
-        ('SPAN', (0, 0), (-1, 0)),
-    ]))
+    period_table = Table(period_data, colWidths=INFO_COL_WIDTHS)
+    period_table.setStyle(INFO_TABLE_STYLE)
     story.append(period_table)
     story.append(Spacer(1, 0.3*inch))
 
     # Daily Attendance - first 15 days for PDF (to fit on page)
     attendance_data = [['Date', 'Day', 'Status', 'Hours', 'OT', 'Notes']]
 
-    for record in daily_records[:15]:  # Show first 15 days
+    for date, day, status, hours, overtime, notes in attendance_rows(attendance)[:15]:  # Show first 15 days
         attendance_data.append([
-            record['date'],
-            record['day'][:3],  # Abbreviated day
-            record['status'],
-            str(record['hours_worked']),
-            str(record['overtime_hours']),
-            record['notes'][:20]  # Truncate notes
+            date,
+            day[:3],  # Abbreviated day
+            status,
+            str(hours),
+            str(overtime),
+            notes[:20]  # Truncate notes
         ])
 
-    attendance_table = Table(attendance_data, colWidths=[1*inch, 0.6*inch, 1*inch, 0.6*inch, 0.5*inch, 2.3*inch])
-    attendance_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2d3748')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('FONTSIZE', (0, 1), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#cbd5e0')),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f7fafc')]),
-    ]))
-    story.append(Paragraph("DAILY ATTENDANCE RECORD (First 15 Days)", styles['Heading2']))
+    attendance_table = Table(attendance_data, colWidths=ATTENDANCE_COL_WIDTHS)
+    attendance_table.setStyle(ATTENDANCE_TABLE_STYLE)
+    story.append(Paragraph("DAILY ATTENDANCE RECORD (First 15 Days)", STYLES['Heading2']))
     story.append(Spacer(1, 0.1*inch))
     story.append(attendance_table)
     story.append(Spacer(1, 0.3*inch))
 
-    # Calculate summary
-    df_daily = pd.DataFrame(daily_records)
-    total_regular_hours = df_daily[df_daily['status'].isin(['Present', 'Half Day'])]['hours_worked'].sum()
-    total_overtime_hours = df_daily['overtime_hours'].sum()
-    total_leave_days = len(df_daily[df_daily['status'] == 'Leave'])
-    holiday_work_hours = df_daily[df_daily['status'] == 'Holiday Work']['hours_worked'].sum()
-
     # Summary Table
     summary_data = [
         ['TIMESHEET SUMMARY', ''],
-        ['Total Regular Hours:', f"{total_regular_hours} hrs"],
-        ['Total Overtime Hours:', f"{total_overtime_hours} hrs"],
-        ['Total Leave Days:', f"{total_leave_days} days"],
-        ['Holiday Work Hours:', f"{holiday_work_hours} hrs"],
+        ['Total Regular Hours:', f"{totals['total_regular_hours']} hrs"],
+        ['Total Overtime Hours:', f"{totals['total_overtime_hours']} hrs"],
+        ['Total Leave Days:', f"{totals['total_leave_days']} days"],
+        ['Holiday Work Hours:', f"{totals['holiday_work_hours']} hrs"],
         ['Hourly Rate:', f"${employee['hourly_rate']:.2f}"],
         ['Overtime Rate:', f"${employee['overtime_rate']:.2f}"],
     ]
 
-    summary_table = Table(summary_data, colWidths=[2.5*inch, 2*inch])
-    summary_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c5282')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#ebf8ff')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#4299e1')),
-        ('SPAN', (0, 0), (-1, 0)),
-    ]))
+    summary_table = Table(summary_data, colWidths=SUMMARY_COL_WIDTHS)
+    summary_table.setStyle(SUMMARY_TABLE_STYLE)
     story.append(summary_table)
     story.append(Spacer(1, 0.4*inch))
 
     # Footer
-    footer_style = ParagraphStyle(
-        'Footer',
-        parent=styles['Normal'],
-        fontSize=8,
-        textColor=colors.HexColor('#718096'),
-        alignment=1
-    )
-    story.append(Paragraph("This is a computer-generated timesheet. For complete daily records, please refer to the Excel version.", footer_style))
-    story.append(Paragraph(f"Generated on: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}", footer_style))
+    story.append(Paragraph("This is a computer-generated timesheet. For complete daily records, please refer to the Excel version.", FOOTER_STYLE))
+    story.append(Paragraph(f"Generated on: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}", FOOTER_STYLE))
 
     # Build PDF
     pdf.build(story)
@@ -424,25 +446,31 @@ def create_pdf_timesheet(employee, daily_records):
     print(f"Created PDF: {filename}")
     return filename
 
-# Generate timesheets for all employees
-print("Generating dummy timesheets for 10 employees...\n")
-
-for employee in employees:
+def build_one(employee, seed_sequence):
+    """Generate the attendance, Excel and PDF timesheets for one employee"""
     print(f"Processing {employee['name']} ({employee['employee_id']})...")
 
     # Generate daily attendance
-    daily_records = generate_daily_attendance(employee)
+    attendance, totals = generate_daily_attendance(employee, np.random.default_rng(seed_sequence))
 
     # Create Excel timesheet
-    create_excel_timesheet(employee, daily_records)
+    create_excel_timesheet(employee, attendance, totals)
 
     # Create PDF timesheet
-    create_pdf_timesheet(employee, daily_records)
+    create_pdf_timesheet(employee, attendance, totals)
 
     print(f"Completed {employee['name']}\n")
 
-print("=" * 60)
-print("All timesheets generated successfully!")
-print(f"Excel files: timesheets/excel/")
-print(f"PDF files: timesheets/pdf/")
-print("=" * 60)
+if __name__ == "__main__":
+    # Generate timesheets for all employees, one worker process per core
+    print("Generating dummy timesheets for 10 employees...\n")
+
+    seed_sequences = np.random.SeedSequence(RANDOM_SEED).spawn(len(employees))
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(build_one, employees, seed_sequences))
+
+    print("=" * 60)
+    print("All timesheets generated successfully!")
+    print(f"Excel files: timesheets/excel/")
+    print(f"PDF files: timesheets/pdf/")
+    print("=" * 60)
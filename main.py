@@ -3,8 +3,8 @@ Main Execution Script for Timesheet to Salary Slip System
 Processes all timesheets and generates salary slips
 """
 import os
-import glob
-from workflow import TimesheetWorkflow
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from workflow import BANNER, DIVIDER, RULE, TimesheetWorkflow
 from datetime import datetime
 
 
@@ -17,12 +17,12 @@ def process_all_timesheets(timesheet_dir: str = None):
             timesheet_dir = "timesheets/excel"
     """Process all Excel timesheets in the specified directory"""
 
-    print("\n" + "█"*80)
+    print("\n" + BANNER)
     print("TIMESHEET TO SALARY SLIP PROCESSING SYSTEM")
-    print("█"*80)
+    print(BANNER)
     print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"Timesheet Directory: {timesheet_dir}")
-    print("█"*80 + "\n")
+    print(BANNER + "\n")
 
     # Check if directory exists
     if not os.path.exists(timesheet_dir):
@@ -31,7 +31,8 @@ def process_all_timesheets(timesheet_dir: str = None):
         return
 
     # Find all Excel files
-    timesheet_files = glob.glob(os.path.join(timesheet_dir, "*.xlsx"))
+    with os.scandir(timesheet_dir) as entries:
+        timesheet_files = sorted(entry.path for entry in entries if entry.name.endswith(".xlsx") and entry.is_file())
 
     if not timesheet_files:
         print(f"❌ Error: No Excel files found in {timesheet_dir}")
@@ -39,33 +40,37 @@ def process_all_timesheets(timesheet_dir: str = None):
 
     print(f"📋 Found {len(timesheet_files)} timesheets to process\n")
 
-    # Initialize workflow
+    # Initialize workflow; its agents and compiled graph are shared by the worker threads
     workflow = TimesheetWorkflow()
 
-    # Process each timesheet
-    results = []
+    # Process the timesheets concurrently, keeping results in file order
+    results = [None] * len(timesheet_files)
     successful = 0
     failed = 0
 
-    for idx, timesheet_file in enumerate(timesheet_files, 1):
-        print(f"\n{'='*80}")
-        print(f"Processing {idx}/{len(timesheet_files)}")
-        print(f"{'='*80}\n")
-
-        # Process the timesheet
-        result = workflow.process_timesheet(timesheet_file)
-        results.append({
-            "file": os.path.basename(timesheet_file),
-            "status": result["workflow_status"],
-            "salary_slip": result.get("salary_slip_path"),
-            "employee_name": result["timesheet_data"].employee.name if result["timesheet_data"] else "N/A",
-            "net_salary": result["salary_calculation"].net_salary if result["salary_calculation"] else 0
-        })
-
-        if result["workflow_status"] == "completed":
-            successful += 1
-        else:
-            failed += 1
+    with ThreadPoolExecutor(max_workers=int(os.getenv("PAYROLL_CONCURRENCY", "8"))) as executor:
+        futures = {
+            executor.submit(workflow.process_timesheet, timesheet_file): idx
+            for idx, timesheet_file in enumerate(timesheet_files)
+        }
+
+        for completed, future in enumerate(as_completed(futures), 1):
+            idx = futures[future]
+            print(f"\n{RULE}\nProcessed {completed}/{len(timesheet_files)}\n{RULE}\n")
+
+            result = future.result()
+            results[idx] = {
+                "file": os.path.basename(timesheet_files[idx]),
+                "status": result["workflow_status"],
+                "salary_slip": result.get("salary_slip_path"),
+                "employee_name": result["timesheet_data"].employee.name if result["timesheet_data"] else "N/A",
+                "net_salary": result["salary_calculation"].net_salary if result["salary_calculation"] else 0
+            }
+
+            if result["workflow_status"] == "completed":
+                successful += 1
+            else:
+                failed += 1
 
     # Print final summary
     print_final_summary(results, successful, failed)
@@ -73,16 +78,16 @@ def process_all_timesheets(timesheet_dir: str = None):
 
 def print_final_summary(results, successful, failed):
     """Print comprehensive final summary"""
-    print("\n\n" + "█"*80)
+    print("\n\n" + BANNER)
     print("FINAL PROCESSING SUMMARY")
-    print("█"*80)
+    print(BANNER)
     print(f"Completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"\nTotal Timesheets Processed: {len(results)}")
     print(f"✓ Successful: {successful}")
     print(f"✗ Failed: {failed}")
-    print("\n" + "-"*80)
+    print("\n" + DIVIDER)
     print("Detailed Results:")
-    print("-"*80)
+    print(DIVIDER)
 
     for idx, result in enumerate(results, 1):
         status_icon = "✓" if result["status"] == "completed" else "✗"
@@ -95,9 +100,9 @@ def print_final_summary(results, successful, failed):
             print(f"   Salary Slip: {os.path.basename(result['salary_slip'])}")
 
     if successful > 0:
-        print("\n" + "="*80)
+        print("\n" + RULE)
         print("✓ SALARY SLIPS GENERATED SUCCESSFULLY!")
-        print("="*80)
+        print(RULE)
         print(f"Location: salary_slips/")
         print(f"Total Files: {successful}")
 
@@ -110,11 +115,11 @@ def print_final_summary(results, successful, failed):
 
 def process_single_timesheet(timesheet_path: str):
     """Process a single timesheet file"""
-    print("\n" + "█"*80)
+    print("\n" + BANNER)
     print("TIMESHEET TO SALARY SLIP PROCESSING SYSTEM")
-    print("█"*80)
+    print(BANNER)
     print(f"Processing single timesheet: {timesheet_path}")
-    print("█"*80 + "\n")
+    print(BANNER + "\n")
 
     if not os.path.exists(timesheet_path):
         print(f"❌ Error: File not found: {timesheet_path}")
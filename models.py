@@ -1,13 +1,27 @@
 """
 Data models for the Timesheet to Salary Slip System
 """
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict
-from datetime import datetime
+from dataclasses import dataclass
+from pydantic import BaseModel, ConfigDict
+from typing import Optional
+
+__all__ = [
+    "EmployeeInfo",
+    "WorkingHours",
+    "PayPeriod",
+    "TimesheetData",
+    "GrossSalary",
+    "Deductions",
+    "SalaryCalculation",
+    "SalarySlipData",
+]
 
 
 class EmployeeInfo(BaseModel):
     """Employee information model"""
+    # Read-only once the parser builds it; the schema is built on first use, not at import
+    model_config = ConfigDict(frozen=True, extra="ignore", validate_assignment=False, defer_build=True)
+
     employee_id: str
     name: str
     department: str
@@ -16,15 +30,20 @@ class EmployeeInfo(BaseModel):
     bank_account: str
 
 
-class WorkingHours(BaseModel):
+# The models below are only ever built from trusted agent output, so they are
+# plain frozen dataclasses and skip pydantic validation entirely
+
+@dataclass(frozen=True)
+class WorkingHours:
     """Working hours breakdown"""
-    regular_hours: float = Field(description="Total regular working hours")
-    overtime_hours: float = Field(description="Total overtime hours")
-    leave_days: int = Field(description="Number of leave days taken")
-    holiday_work_hours: float = Field(default=0, description="Hours worked on holidays")
+    regular_hours: float  # Total regular working hours
+    overtime_hours: float  # Total overtime hours
+    leave_days: int  # Number of leave days taken
+    holiday_work_hours: float = 0.0  # Hours worked on holidays
 
 
-class PayPeriod(BaseModel):
+@dataclass(frozen=True)
+class PayPeriod:
     """Pay period information"""
     start_date: str
     end_date: str
@@ -32,6 +51,8 @@ class PayPeriod(BaseModel):
 
 class TimesheetData(BaseModel):
     """Complete timesheet data extracted from input"""
+    model_config = ConfigDict(frozen=True, extra="ignore", validate_assignment=False, defer_build=True)
+
     employee: EmployeeInfo
     period: PayPeriod
     hours: WorkingHours
@@ -39,26 +60,29 @@ class TimesheetData(BaseModel):
     overtime_rate: Optional[float] = None
 
 
-class GrossSalary(BaseModel):
+@dataclass(frozen=True)
+class GrossSalary:
     """Gross salary breakdown"""
     base_pay: float
     overtime_pay: float
-    allowances: float = Field(default=0, description="Additional allowances")
-    bonuses: float = Field(default=0, description="Performance bonuses")
     total_gross: float
+    allowances: float = 0.0  # Additional allowances
+    bonuses: float = 0.0  # Performance bonuses
 
 
-class Deductions(BaseModel):
+@dataclass(frozen=True)
+class Deductions:
     """Salary deductions breakdown"""
     income_tax: float
     social_security: float
-    insurance: float = Field(default=0)
-    provident_fund: float = Field(default=0)
-    other_deductions: float = Field(default=0)
     total_deductions: float
+    insurance: float = 0.0
+    provident_fund: float = 0.0
+    other_deductions: float = 0.0
 
 
-class SalaryCalculation(BaseModel):
+@dataclass(frozen=True)
+class SalaryCalculation:
     """Complete salary calculation"""
     employee_id: str
     gross_salary: GrossSalary
@@ -67,7 +91,8 @@ class SalaryCalculation(BaseModel):
     calculation_date: str
 
 
-class SalarySlipData(BaseModel):
+@dataclass(frozen=True)
+class SalarySlipData:
     """Complete data for salary slip generation"""
     employee: EmployeeInfo
     period: PayPeriod
@@ -75,30 +100,3 @@ class SalarySlipData(BaseModel):
     salary: SalaryCalculation
     company_name: str = "TechCorp Industries Inc."
     company_address: str = "123 Business Avenue, San Francisco, CA 94102"
-
-
-class AgentState(BaseModel):
-    """State object passed between agents in LangGraph"""
-    # Input
-    timesheet_file_path: str
-
-    # Agent 1 Output
-    timesheet_data: Optional[TimesheetData] = None
-    extraction_status: str = "pending"
-    extraction_error: Optional[str] = None
-
-    # Agent 2 Output
-    salary_calculation: Optional[SalaryCalculation] = None
-    calculation_status: str = "pending"
-    calculation_error: Optional[str] = None
-
-    # Agent 3 Output
-    salary_slip_path: Optional[str] = None
-    generation_status: str = "pending"
-    generation_error: Optional[str] = None
-
-    # Overall status
-    workflow_status: str = "started"
-
-    class Config:
-        arbitrary_types_allowed = True
@@ -0,0 +1,66 @@
+"""
+Tests for the settings snapshot shared by the calculator's scalar and batch paths
+"""
+import unittest
+from datetime import datetime
+
+from agents.agent2_calculator import WageCalculatorAgent
+from models import EmployeeInfo, PayPeriod, TimesheetData, WorkingHours
+
+
+def make_timesheet(employee_id: str, regular_hours: float, hourly_rate: float) -> TimesheetData:
+    return TimesheetData(
+        employee=EmployeeInfo(
+            employee_id=employee_id,
+            name="Test Employee",
+            department="Engineering",
+            designation="Engineer",
+            email="test@company.com",
+            bank_account="1234567890"
+        ),
+        period=PayPeriod(start_date="2025-10-01", end_date="2025-10-31"),
+        hours=WorkingHours(regular_hours=regular_hours, overtime_hours=6.5, leave_days=1, holiday_work_hours=8.0),
+        hourly_rate=hourly_rate,
+        overtime_rate=hourly_rate * 1.5
+    )
+
+
+class SettingsSnapshotTest(unittest.TestCase):
+    """Batch and scalar results must agree for the same settings snapshot"""
+
+    def setUp(self):
+        self.agent = WageCalculatorAgent()
+        self.timesheets = [
+            make_timesheet(f"EMP{idx:03d}", regular_hours, hourly_rate)
+            for idx, (regular_hours, hourly_rate) in enumerate([(120.0, 18.25), (160.0, 32.5), (168.0, 61.75)])
+        ]
+
+    def calculate(self):
+        now = datetime(2025, 10, 31)
+        scalar = [self.agent.process(timesheet_data, now)["data"] for timesheet_data in self.timesheets]
+        batch = [result["data"] for result in self.agent.process_batch(self.timesheets, now)]
+        return scalar, batch
+
+    def test_unrefreshed_changes_are_ignored_by_both_paths(self):
+        before, _ = self.calculate()
+        self.agent.social_security_rate = 0.09
+        self.agent.insurance_flat = 250.0
+        self.agent.tax_brackets[0]["rate"] = 0.5
+
+        scalar, batch = self.calculate()
+        self.assertEqual(scalar, before)
+        self.assertEqual(batch, before)
+
+    def test_refreshed_changes_apply_to_both_paths(self):
+        self.agent.insurance_flat = 250.0
+        self.agent.tax_brackets[0]["rate"] = 0.5
+        self.agent.refresh_settings()
+
+        scalar, batch = self.calculate()
+        self.assertEqual(batch, scalar)
+        self.assertEqual(scalar[0].deductions.insurance, 250.0)
+        self.assertEqual(scalar[0].deductions.income_tax, self.agent.calculate_progressive_tax(scalar[0].gross_salary.total_gross))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+Tests for the batch pipeline in TimesheetWorkflow.process_batch
+"""
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from agents.agent3_pdf_generator import SalarySlipGeneratorAgent
+from workflow import TimesheetWorkflow
+
+
+class ProcessBatchTest(unittest.TestCase):
+    """A failing timesheet must fail on its own without stalling the batch"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._cwd = os.getcwd()
+        cls._tmp = tempfile.TemporaryDirectory()
+        os.chdir(cls._tmp.name)
+
+        # The generator script writes into timesheets/ under the working directory
+        import generate_dummy_timesheets as dummy
+
+        cls.paths = []
+        for employee in dummy.employees[:4]:
+            attendance, totals = dummy.generate_daily_attendance(employee)
+            cls.paths.append(os.path.abspath(dummy.create_excel_timesheet(employee, attendance, totals)))
+
+    @classmethod
+    def tearDownClass(cls):
+        os.chdir(cls._cwd)
+        cls._tmp.cleanup()
+
+    def setUp(self):
+        self.workflow = TimesheetWorkflow(verbose=False)
+        self.workflow.generator_agent = SalarySlipGeneratorAgent(os.path.join(self._tmp.name, "salary_slips"))
+
+    def run_batch(self):
+        return asyncio.run(asyncio.wait_for(
+            self.workflow.process_batch(self.paths, concurrency=2, renderers=2), timeout=60
+        ))
+
+    def fail_for(self, method, failing_path):
+        """Wrap a node so it raises for one timesheet and runs normally for the rest"""
+        def node(state):
+            if state["timesheet_file_path"] == failing_path:
+                raise RuntimeError("injected failure")
+            return method(state)
+        return node
+
+    def assert_only_failed(self, states, failing_path, workflow_status):
+        self.assertEqual([state["timesheet_file_path"] for state in states], self.paths)
+        for state in states:
+            if state["timesheet_file_path"] == failing_path:
+                self.assertEqual(state["workflow_status"], workflow_status)
+            else:
+                self.assertEqual(state["workflow_status"], "completed")
+                self.assertTrue(os.path.exists(state["salary_slip_path"]))
+
+    def test_all_succeed(self):
+        states = self.run_batch()
+        self.assertTrue(all(state["workflow_status"] == "completed" for state in states))
+
+    def test_parse_failure(self):
+        failing_path = self.paths[1]
+        self.workflow.agent1_parse_timesheet = self.fail_for(self.workflow.agent1_parse_timesheet, failing_path)
+        states = self.run_batch()
+        self.assert_only_failed(states, failing_path, "failed_at_parsing")
+        self.assertEqual(states[1]["extraction_error"], "injected failure")
+
+    def test_calculation_failure(self):
+        # A timesheet without an hourly rate fails in the calculator's batch path
+        failing_path = self.paths[1]
+        parse_timesheet = self.workflow.agent1_parse_timesheet
+
+        def parse(state):
+            update = parse_timesheet(state)
+            if state["timesheet_file_path"] == failing_path:
+                update["timesheet_data"] = update["timesheet_data"].model_copy(update={"hourly_rate": None})
+            return update
+
+        self.workflow.agent1_parse_timesheet = parse
+        states = self.run_batch()
+        self.assert_only_failed(states, failing_path, "failed_at_calculation")
+        self.assertIn("NoneType", states[1]["calculation_error"])
+
+    def test_calculator_exception(self):
+        calculator_agent = self.workflow.calculator_agent
+        with mock.patch.object(calculator_agent, "process_batch", side_effect=RuntimeError("injected failure")):
+            states = self.run_batch()
+        for state in states:
+            self.assertEqual(state["workflow_status"], "failed_at_calculation")
+            self.assertEqual(state["calculation_error"], "injected failure")
+
+    def test_render_failure(self):
+        failing_path = self.paths[2]
+        failing_id = os.path.basename(failing_path).split("_")[0]
+        prepare_slip = self.workflow.generator_agent.prepare_slip
+
+        def prepare(timesheet_data, salary_calculation):
+            if timesheet_data.employee.employee_id == failing_id:
+                raise RuntimeError("injected failure")
+            return prepare_slip(timesheet_data, salary_calculation)
+
+        with mock.patch.object(self.workflow.generator_agent, "prepare_slip", side_effect=prepare):
+            states = self.run_batch()
+        self.assert_only_failed(states, failing_path, "failed_at_generation")
+        self.assertEqual(states[2]["generation_error"], "injected failure")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,13 +2,46 @@
 LangGraph Workflow for Timesheet to Salary Slip System
 Orchestrates the three agents in a sequential workflow
 """
-from typing import TypedDict, Annotated, Optional
-from langgraph.graph import StateGraph, END
-from agents.agent1_parser import TimesheetParserAgent
-from agents.agent2_calculator import WageCalculatorAgent
-from agents.agent3_pdf_generator import SalarySlipGeneratorAgent
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import lru_cache, partial
+import logging
+from multiprocessing import get_context
+from operator import itemgetter
+import os
+from pathlib import Path
+import sys
+from typing import TYPE_CHECKING, TypedDict, Dict, List, Optional
+# LangGraph resolves the WorkflowState annotations at build time, so the
+# (lightweight) models stay a real import
 from models import TimesheetData, SalaryCalculation
 
+if TYPE_CHECKING:
+    from agents.agent1_parser import TimesheetParserAgent
+    from agents.agent2_calculator import WageCalculatorAgent
+    from agents.agent3_pdf_generator import SalarySlipGeneratorAgent
+    from langchain_core.runnables import RunnableConfig
+    from langgraph.graph.state import CompiledStateGraph
+
+logger = logging.getLogger(__name__)
+
+# Rules used by the printed summaries
+BANNER = "█" * 80
+RULE = "=" * 80
+DIVIDER = "-" * 80
+
+# Every state field the summary reads, fetched in one call
+_SUMMARY_FIELDS = itemgetter(
+    "timesheet_file_path", "workflow_status",
+    "extraction_status", "extraction_error",
+    "calculation_status", "calculation_error",
+    "generation_status", "generation_error",
+    "salary_slip_path", "timesheet_data", "salary_calculation"
+)
+
 
 # Define the state that will be passed between agents
 class WorkflowState(TypedDict):
@@ -27,7 +60,7 @@ class WorkflowState(TypedDict):
     calculation_error: Optional[str]
 
     # Agent 3 outputs
-    salary_slip_path: Optional[str]
+    salary_slip_path: Optional[Path]
     generation_status: str
     generation_error: Optional[str]
 
@@ -35,197 +68,400 @@ class WorkflowState(TypedDict):
     workflow_status: str
 
 
+def create_initial_state(timesheet_file_path: str) -> WorkflowState:
+    """Build the starting workflow state for a timesheet file"""
+    return {
+        "timesheet_file_path": timesheet_file_path,
+        "timesheet_data": None,
+        "extraction_status": "pending",
+        "extraction_error": None,
+        "salary_calculation": None,
+        "calculation_status": "pending",
+        "calculation_error": None,
+        "salary_slip_path": None,
+        "generation_status": "pending",
+        "generation_error": None,
+        "workflow_status": "started"
+    }
+
+
+# The agents pull in openpyxl/calamine, numpy and reportlab, so they are only
+# imported when first requested
+
+@lru_cache(maxsize=1)
+def get_parser_agent() -> TimesheetParserAgent:
+    """Return the process-wide timesheet parser agent"""
+    from agents.agent1_parser import TimesheetParserAgent
+    return TimesheetParserAgent()
+
+
+@lru_cache(maxsize=1)
+def get_calculator_agent() -> WageCalculatorAgent:
+    """Return the process-wide wage calculator agent"""
+    from agents.agent2_calculator import WageCalculatorAgent
+    return WageCalculatorAgent()
+
+
+@lru_cache(maxsize=1)
+def get_generator_agent() -> SalarySlipGeneratorAgent:
+    """Return the process-wide salary slip generator agent"""
+    from agents.agent3_pdf_generator import SalarySlipGeneratorAgent
+    return SalarySlipGeneratorAgent()
+
+
 class TimesheetWorkflow:
     """Main workflow orchestrator using LangGraph"""
 
-    def __init__(self):
-        self.parser_agent = TimesheetParserAgent()
-        self.calculator_agent = WageCalculatorAgent()
-        self.generator_agent = SalarySlipGeneratorAgent()
+    def __init__(self, verbose: bool = True):
+        # Print a summary after each timesheet; step progress is logged at INFO
+        self.verbose = verbose
+
+        # Agents are shared by every workflow in the process
+        self.parser_agent = get_parser_agent()
+        self.calculator_agent = get_calculator_agent()
+        self.generator_agent = get_generator_agent()
 
-        # Build the workflow graph
-        self.workflow = self._build_workflow()
+        # Compile the shared workflow graph up front; later instances reuse it
+        _compile_workflow()
 
-    def agent1_parse_timesheet(self, state: WorkflowState) -> WorkflowState:
+    def invoke(self, initial_state: WorkflowState) -> WorkflowState:
+        """Run the shared compiled graph with this workflow's agents"""
+        return _compile_workflow().invoke(initial_state, {"configurable": {"workflow": self}})
+
+    def agent1_parse_timesheet(self, state: WorkflowState) -> Dict:
         """Node: Agent 1 - Parse timesheet and extract data"""
-        print("\n" + "="*80)
-        print("STEP 1: TIMESHEET PARSING")
-        print("="*80)
+        logger.info("STEP 1: TIMESHEET PARSING")
 
         result = self.parser_agent.process(state["timesheet_file_path"])
 
-        if result["success"]:
-            state["timesheet_data"] = result["data"]
-            state["extraction_status"] = "success"
-            state["extraction_error"] = None
-        else:
-            state["timesheet_data"] = None
-            state["extraction_status"] = "failed"
-            state["extraction_error"] = result["error"]
-            state["workflow_status"] = "failed_at_parsing"
-
-        return state
+        # Return only the keys this step sets; LangGraph merges them into the state
+        return _extraction_update(result)
 
-    def agent2_calculate_salary(self, state: WorkflowState) -> WorkflowState:
+    def agent2_calculate_salary(self, state: WorkflowState) -> Dict:
         """Node: Agent 2 - Calculate wages and deductions"""
-        print("\n" + "="*80)
-        print("STEP 2: SALARY CALCULATION")
-        print("="*80)
-
-        # Check if previous step was successful
-        if state["extraction_status"] != "success":
-            print("[Workflow] Skipping salary calculation due to parsing failure")
-            state["calculation_status"] = "skipped"
-            return state
+        logger.info("STEP 2: SALARY CALCULATION")
 
         result = self.calculator_agent.process(state["timesheet_data"])
 
-        if result["success"]:
-            state["salary_calculation"] = result["data"]
-            state["calculation_status"] = "success"
-            state["calculation_error"] = None
-        else:
-            state["salary_calculation"] = None
-            state["calculation_status"] = "failed"
-            state["calculation_error"] = result["error"]
-            state["workflow_status"] = "failed_at_calculation"
+        return _calculation_update(result)
 
-        return state
+    def agent2_calculate_salaries(self, states: List[WorkflowState]) -> List[Dict]:
+        """Agent 2 for many parsed timesheets at once, using the calculator's vectorized batch path"""
+        logger.info("STEP 2: SALARY CALCULATION (%d timesheets)", len(states))
 
-    def agent3_generate_pdf(self, state: WorkflowState) -> WorkflowState:
-        """Node: Agent 3 - Generate salary slip PDF"""
-        print("\n" + "="*80)
-        print("STEP 3: PDF GENERATION")
-        print("="*80)
+        results = self.calculator_agent.process_batch([state["timesheet_data"] for state in states])
 
-        # Check if previous steps were successful
-        if state["calculation_status"] != "success":
-            print("[Workflow] Skipping PDF generation due to calculation failure")
-            state["generation_status"] = "skipped"
-            return state
+        return [_calculation_update(result) for result in results]
+
+    def agent3_generate_pdf(self, state: WorkflowState) -> Dict:
+        """Node: Agent 3 - Generate salary slip PDF"""
+        logger.info("STEP 3: PDF GENERATION")
 
         result = self.generator_agent.process(
             state["timesheet_data"],
             state["salary_calculation"]
         )
 
-        if result["success"]:
-            state["salary_slip_path"] = result["file_path"]
-            state["generation_status"] = "success"
-            state["generation_error"] = None
-            state["workflow_status"] = "completed"
-        else:
-            state["salary_slip_path"] = None
-            state["generation_status"] = "failed"
-            state["generation_error"] = result["error"]
-            state["workflow_status"] = "failed_at_generation"
-
-        return state
+        return _generation_update(result)
 
-    def _build_workflow(self) -> StateGraph:
-        """Build the LangGraph workflow"""
-        # Create the graph
-        workflow = StateGraph(WorkflowState)
-
-        # Add nodes (agents)
-        workflow.add_node("parse_timesheet", self.agent1_parse_timesheet)
-        workflow.add_node("calculate_salary", self.agent2_calculate_salary)
-        workflow.add_node("generate_pdf", self.agent3_generate_pdf)
-
-        # Define edges (flow)
-        workflow.set_entry_point("parse_timesheet")
-        workflow.add_edge("parse_timesheet", "calculate_salary")
-        workflow.add_edge("calculate_salary", "generate_pdf")
-        workflow.add_edge("generate_pdf", END)
-
-        # Compile the graph
-        return workflow.compile()
-
-    def process_timesheet(self, timesheet_file_path: str) -> WorkflowState:
+    def process_timesheet(self, timesheet_file_path: str, verbose: Optional[bool] = None) -> WorkflowState:
         """Process a single timesheet through the complete workflow"""
-        print("\n" + "█"*80)
-        print("TIMESHEET TO SALARY SLIP WORKFLOW")
-        print(f"Processing: {timesheet_file_path}")
-        print("█"*80)
+        logger.info("Processing: %s", timesheet_file_path)
 
         # Initialize state
-        initial_state: WorkflowState = {
-            "timesheet_file_path": timesheet_file_path,
-            "timesheet_data": None,
-            "extraction_status": "pending",
-            "extraction_error": None,
-            "salary_calculation": None,
-            "calculation_status": "pending",
-            "calculation_error": None,
-            "salary_slip_path": None,
-            "generation_status": "pending",
-            "generation_error": None,
-            "workflow_status": "started"
-        }
+        initial_state = create_initial_state(timesheet_file_path)
 
         # Run the workflow
-        final_state = self.workflow.invoke(initial_state)
+        final_state = self.invoke(initial_state)
 
         # Print summary
-        self._print_summary(final_state)
+        if self.verbose if verbose is None else verbose:
+            self._print_summary(final_state)
 
         return final_state
 
+    async def process_batch(self, timesheet_file_paths: List[str], concurrency: Optional[int] = None,
+                            verbose: Optional[bool] = None, renderers: Optional[int] = None) -> List[WorkflowState]:
+        """Process many timesheets as a parse -> calculate -> render pipeline, returning the final states in input order"""
+        from agents.agent3_pdf_generator import FOOTER_DATE_FORMAT
+
+        # Parsing is I/O bound and runs on PAYROLL_CONCURRENCY threads (default 8), one task
+        # calculates whatever has been parsed in vectorized micro-batches, and PDFs render
+        # in worker processes
+        parsers = concurrency or int(os.getenv("PAYROLL_CONCURRENCY", "8"))
+        renderers = renderers or os.cpu_count() or 1
+        states = [create_initial_state(timesheet_file_path) for timesheet_file_path in timesheet_file_paths]
+        generated_on = datetime.now().strftime(FOOTER_DATE_FORMAT)
+        loop = asyncio.get_running_loop()
+
+        # Bounded queues between the stages give backpressure; None tells a stage to stop
+        parse_queue = asyncio.Queue()
+        calculate_queue = asyncio.Queue(maxsize=parsers * 2)
+        render_queue = asyncio.Queue(maxsize=renderers * 2)
+        for state in states:
+            parse_queue.put_nowait(state)
+        for _ in range(parsers):
+            parse_queue.put_nowait(None)
+
+        # Each stage turns an exception for one timesheet into a failed state for
+        # that timesheet, the same way the agents report their own errors
+        async def parse_stage():
+            while (state := await parse_queue.get()) is not None:
+                try:
+                    update = await asyncio.to_thread(self.agent1_parse_timesheet, state)
+                except Exception as e:
+                    update = _extraction_update({"success": False, "data": None, "error": str(e)})
+                state.update(update)
+                if state["extraction_status"] == "success":
+                    await calculate_queue.put(state)
+
+        async def calculate_stage():
+            done = False
+            while not done:
+                # Wait for one parsed timesheet, then take every other one already queued
+                batch = []
+                while not batch or not calculate_queue.empty():
+                    state = await calculate_queue.get()
+                    if state is None:
+                        done = True
+                        break
+                    batch.append(state)
+                if not batch:
+                    continue
+
+                try:
+                    updates = self.agent2_calculate_salaries(batch)
+                except Exception as e:
+                    updates = [_calculation_update({"success": False, "data": None, "error": str(e)})] * len(batch)
+                for state, update in zip(batch, updates):
+                    state.update(update)
+                    if state["calculation_status"] == "success":
+                        await render_queue.put(state)
+
+        async def render_stage(executor: ProcessPoolExecutor):
+            while (state := await render_queue.get()) is not None:
+                try:
+                    render, output_path = self.generator_agent.submit_slip(
+                        executor, state["timesheet_data"], state["salary_calculation"], generated_on
+                    )
+                    pdf_bytes = await asyncio.wrap_future(render)
+                    result = await asyncio.to_thread(self.generator_agent.save_slip, output_path, pdf_bytes)
+                except Exception as e:
+                    result = {"success": False, "file_path": None, "error": str(e)}
+                state.update(_generation_update(result))
+
+        async def send_sentinels(parse_tasks, calculate_task, render_tasks):
+            # Stop each stage once the stage feeding it has drained
+            await asyncio.gather(*parse_tasks)
+            await calculate_queue.put(None)
+            await calculate_task
+            for _ in range(renderers):
+                await render_queue.put(None)
+            await asyncio.gather(*render_tasks)
+
+        # Spawned rather than forked: the parse stage's threads already exist by the time
+        # the pool starts its workers
+        executor = ProcessPoolExecutor(max_workers=renderers, mp_context=get_context("spawn"))
+        parse_tasks = [asyncio.create_task(parse_stage()) for _ in range(parsers)]
+        calculate_task = asyncio.create_task(calculate_stage())
+        render_tasks = [asyncio.create_task(render_stage(executor)) for _ in range(renderers)]
+        tasks = [*parse_tasks, calculate_task, *render_tasks]
+        tasks.append(asyncio.create_task(send_sentinels(parse_tasks, calculate_task, render_tasks)))
+
+        try:
+            # A stage that dies would leave its neighbours blocked on the queues,
+            # so stop waiting as soon as any task fails
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                if not task.cancelled() and task.exception() is not None:
+                    raise task.exception()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            # Shutting down waits for the workers to exit, so keep it off the event loop
+            await loop.run_in_executor(None, partial(executor.shutdown, cancel_futures=True))
+
+        if self.verbose if verbose is None else verbose:
+            for state in states:
+                self._print_summary(state)
+
+        return states
+
     def _print_summary(self, state: WorkflowState):
         """Print workflow execution summary"""
-        print("\n" + "█"*80)
-        print("WORKFLOW EXECUTION SUMMARY")
-        print("█"*80)
-
-        print(f"\n📄 Input File: {state['timesheet_file_path']}")
-        print(f"\n🔄 Workflow Status: {state['workflow_status'].upper()}")
-
-        print("\n" + "-"*80)
-        print("Agent Statuses:")
-        print("-"*80)
+        (file_path, workflow_status, extraction_status, extraction_error, calculation_status,
+         calculation_error, generation_status, generation_error, slip_path, timesheet_data, calc) = _SUMMARY_FIELDS(state)
+
+        lines = [
+            "\n" + BANNER,
+            "WORKFLOW EXECUTION SUMMARY",
+            BANNER,
+            f"\n📄 Input File: {file_path}",
+            f"\n🔄 Workflow Status: {workflow_status.upper()}",
+            "\n" + DIVIDER,
+            "Agent Statuses:",
+            DIVIDER,
+        ]
 
         # Agent 1
-        status_icon = "✓" if state["extraction_status"] == "success" else "✗"
-        print(f"{status_icon} Agent 1 (Parser): {state['extraction_status'].upper()}")
-        if state["extraction_error"]:
-            print(f"  Error: {state['extraction_error']}")
+        status_icon = "✓" if extraction_status == "success" else "✗"
+        lines.append(f"{status_icon} Agent 1 (Parser): {extraction_status.upper()}")
+        if extraction_error:
+            lines.append(f"  Error: {extraction_error}")
 
         # Agent 2
-        status_icon = "✓" if state["calculation_status"] == "success" else "✗" if state["calculation_status"] == "failed" else "⊘"
-        print(f"{status_icon} Agent 2 (Calculator): {state['calculation_status'].upper()}")
-        if state["calculation_error"]:
-            print(f"  Error: {state['calculation_error']}")
+        status_icon = "✓" if calculation_status == "success" else "✗" if calculation_status == "failed" else "⊘"
+        lines.append(f"{status_icon} Agent 2 (Calculator): {calculation_status.upper()}")
+        if calculation_error:
+            lines.append(f"  Error: {calculation_error}")
 
         # Agent 3
-        status_icon = "✓" if state["generation_status"] == "success" else "✗" if state["generation_status"] == "failed" else "⊘"
-        print(f"{status_icon} Agent 3 (PDF Generator): {state['generation_status'].upper()}")
-        if state["generation_error"]:
-            print(f"  Error: {state['generation_error']}")
+        status_icon = "✓" if generation_status == "success" else "✗" if generation_status == "failed" else "⊘"
+        lines.append(f"{status_icon} Agent 3 (PDF Generator): {generation_status.upper()}")
+        if generation_error:
+            lines.append(f"  Error: {generation_error}")
 
-        if state["workflow_status"] == "completed":
-            print("\n" + "="*80)
-            print(f"✓ SUCCESS! Salary slip generated: {state['salary_slip_path']}")
-            print("="*80)
+        if workflow_status == "completed":
+            lines += ["\n" + RULE, f"✓ SUCCESS! Salary slip generated: {slip_path}", RULE]
 
             # Print salary details
-            if state["salary_calculation"]:
-                calc = state["salary_calculation"]
-                print(f"\n💰 Salary Summary for {state['timesheet_data'].employee.name}:")
-                print(f"   Gross Salary: ${calc.gross_salary.total_gross:,.2f}")
-                print(f"   Deductions:   ${calc.deductions.total_deductions:,.2f}")
-                print(f"   Net Salary:   ${calc.net_salary:,.2f}")
+            if calc:
+                lines += [
+                    f"\n💰 Salary Summary for {timesheet_data.employee.name}:",
+                    f"   Gross Salary: ${calc.gross_salary.total_gross:,.2f}",
+                    f"   Deductions:   ${calc.deductions.total_deductions:,.2f}",
+                    f"   Net Salary:   ${calc.net_salary:,.2f}",
+                ]
         else:
-            print("\n" + "="*80)
-            print(f"✗ WORKFLOW FAILED: {state['workflow_status']}")
-            print("="*80)
+            lines += ["\n" + RULE, f"✗ WORKFLOW FAILED: {workflow_status}", RULE]
+
+        lines.append("\n")
+
+        # One write per summary, so summaries from concurrent workflows do not interleave
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _extraction_update(result: Dict) -> Dict:
+    """State keys set by the parsing step for a parser result"""
+    if result["success"]:
+        return {
+            "timesheet_data": result["data"],
+            "extraction_status": "success",
+            "extraction_error": None
+        }
+
+    return {
+        "timesheet_data": None,
+        "extraction_status": "failed",
+        "extraction_error": result["error"],
+        "workflow_status": "failed_at_parsing",
+        # The graph ends here, so the later agents never run
+        "calculation_status": "skipped",
+        "generation_status": "skipped"
+    }
+
+
+def _calculation_update(result: Dict) -> Dict:
+    """State keys set by the calculation step for a calculator result"""
+    if result["success"]:
+        return {
+            "salary_calculation": result["data"],
+            "calculation_status": "success",
+            "calculation_error": None
+        }
+
+    return {
+        "salary_calculation": None,
+        "calculation_status": "failed",
+        "calculation_error": result["error"],
+        "workflow_status": "failed_at_calculation",
+        "generation_status": "skipped"
+    }
+
+
+def _generation_update(result: Dict) -> Dict:
+    """State keys set by the PDF generation step for a generator result"""
+    if result["success"]:
+        return {
+            "salary_slip_path": result["file_path"],
+            "generation_status": "success",
+            "generation_error": None,
+            "workflow_status": "completed"
+        }
+
+    return {
+        "salary_slip_path": None,
+        "generation_status": "failed",
+        "generation_error": result["error"],
+        "workflow_status": "failed_at_generation"
+    }
+
+
+def _parse_timesheet_node(state: WorkflowState, config: RunnableConfig) -> Dict:
+    """Node: Agent 1 - Parse timesheet and extract data"""
+    return config["configurable"]["workflow"].agent1_parse_timesheet(state)
+
+
+def _calculate_salary_node(state: WorkflowState, config: RunnableConfig) -> Dict:
+    """Node: Agent 2 - Calculate wages and deductions"""
+    return config["configurable"]["workflow"].agent2_calculate_salary(state)
 
-        print("\n")
+
+def _generate_pdf_node(state: WorkflowState, config: RunnableConfig) -> Dict:
+    """Node: Agent 3 - Generate salary slip PDF"""
+    return config["configurable"]["workflow"].agent3_generate_pdf(state)
+
+
+def _route_after_parsing(state: WorkflowState) -> str:
+    """Edge: continue to salary calculation only if parsing succeeded"""
+    return "calculate_salary" if state["extraction_status"] == "success" else "end"
+
+
+def _route_after_calculation(state: WorkflowState) -> str:
+    """Edge: continue to PDF generation only if the calculation succeeded"""
+    return "generate_pdf" if state["calculation_status"] == "success" else "end"
+
+
+@lru_cache(maxsize=1)
+def _compile_workflow() -> CompiledStateGraph:
+    """Build and compile the LangGraph workflow once per process
+
+    The nodes look up the TimesheetWorkflow running them in the invoke config,
+    so every workflow instance shares this graph while keeping its own agents.
+    """
+    from langgraph.graph import StateGraph, END
+
+    # Create the graph
+    workflow = StateGraph(WorkflowState)
+
+    # Add nodes (agents)
+    workflow.add_node("parse_timesheet", _parse_timesheet_node)
+    workflow.add_node("calculate_salary", _calculate_salary_node)
+    workflow.add_node("generate_pdf", _generate_pdf_node)
+
+    # Define edges (flow)
+    workflow.set_entry_point("parse_timesheet")
+    # A failed step ends the run instead of passing through the later agents
+    workflow.add_conditional_edges(
+        "parse_timesheet", _route_after_parsing, {"calculate_salary": "calculate_salary", "end": END}
+    )
+    workflow.add_conditional_edges(
+        "calculate_salary", _route_after_calculation, {"generate_pdf": "generate_pdf", "end": END}
+    )
+    workflow.add_edge("generate_pdf", END)
+
+    # Compile the graph
+    return workflow.compile()
+
+
+def create_workflow() -> TimesheetWorkflow:
+    """Build the workflow used by the API; call invoke() on it to run a timesheet"""
+    return TimesheetWorkflow(verbose=False)
 
 
 # Test the workflow
 if __name__ == "__main__":
-    import os
-
     workflow = TimesheetWorkflow()
 
     # Test with a sample timesheet